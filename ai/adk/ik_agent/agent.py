@@ -3,9 +3,10 @@ import datetime
 from zoneinfo import ZoneInfo
 from google.adk.agents import Agent
 
-from google.adk.tools.mcp_tool.mcp_toolset import MCPToolset
 from mcp import StdioServerParameters
 
+from .mcp_pool import PooledMCPToolset
+
 
 def get_weather(city: str) -> dict:
     """Retrieves the current weather report for a specified city.
@@ -54,11 +55,16 @@ def get_current_time(city: str) -> dict:
     return {"status": "success", "report": report}
 
 
-mcp_tool = MCPToolset(
+# Agent sessions lease warm server processes from a shared pool instead of
+# each paying for interpreter start-up and imports; a process is replaced
+# after 500 calls or when it stops answering pings
+mcp_tool = PooledMCPToolset(
     connection_params=StdioServerParameters(
         command="/Users/art/Projects/python-frameworks/.venv/bin/python3",
         args=["/Users/art/Projects/python-frameworks/ai/fastmcp/server.py"],
-    )
+    ),
+    size=2,
+    max_calls=500,
 )
 
 root_agent = Agent(
@@ -0,0 +1,233 @@
+import asyncio
+import logging
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, TextIO
+
+from google.adk.tools.base_tool import BaseTool
+from google.adk.tools.base_toolset import BaseToolset
+from google.genai import types
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+logger = logging.getLogger(__name__)
+
+
+class PooledServer:
+    """One pre-started stdio server process and its initialized session."""
+
+    def __init__(self):
+        self.session: Optional[ClientSession] = None
+        self.calls = 0
+        self.last_used = time.monotonic()
+        self.ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.stop = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        # Started once this server has served ``max_calls`` leases
+        self.replacement: Optional["PooledServer"] = None
+
+    @property
+    def replaced(self) -> bool:
+        return self.replacement is not None and self.replacement.ready.done()
+
+
+class StdioServerPool:
+    """Keep ``size`` stdio MCP server processes warm and lease them out.
+
+    Starting a server costs an interpreter start plus its imports. The pool
+    pays that once per process in the background, so a lease only waits when
+    every server is busy. Before a lease, a server idle for ``ping_after``
+    seconds is health-checked with a ping; one that fails it or raises during
+    a lease is shut down and replaced. A server that has served ``max_calls``
+    leases keeps serving until its replacement is ready, so recycling never
+    leaves a caller waiting on a cold start.
+    """
+
+    def __init__(
+        self,
+        params: StdioServerParameters,
+        size: int = 2,
+        max_calls: int = 500,
+        ping_after: float = 30.0,
+        ping_timeout: float = 5.0,
+        errlog: TextIO = sys.stderr,
+    ):
+        self.params = params
+        self.size = size
+        self.max_calls = max_calls
+        self.ping_after = ping_after
+        self.ping_timeout = ping_timeout
+        self.errlog = errlog
+        self._idle: Optional[asyncio.Queue] = None
+        self._servers: Set[PooledServer] = set()
+        self.started = 0
+        self.recycled = 0
+        self.failed_pings = 0
+
+    async def start(self) -> None:
+        """Start the servers; later calls return at once."""
+        if self._idle is not None:
+            return
+        self._idle = asyncio.Queue()
+        for _ in range(self.size):
+            self._spawn()
+
+    def _spawn(self) -> PooledServer:
+        server = PooledServer()
+        server.task = asyncio.create_task(self._run(server))
+        self._servers.add(server)
+        self.started += 1
+        return server
+
+    async def _run(self, server: PooledServer) -> None:
+        # The stdio transport's task group must be entered and left in the
+        # same task, so each server lives in its own task until it is stopped
+        try:
+            async with stdio_client(self.params, errlog=self.errlog) as streams:
+                async with ClientSession(*streams) as session:
+                    await session.initialize()
+                    server.session = session
+                    server.ready.set_result(None)
+                    self._idle.put_nowait(server)
+                    await server.stop.wait()
+        except Exception as e:
+            logger.warning(f"MCP server process failed: {e}")
+            if not server.ready.done():
+                server.ready.set_exception(e)
+                server.ready.exception()
+                # Wake one waiting caller so a broken server command surfaces
+                if self._idle is not None:
+                    self._idle.put_nowait(e)
+        finally:
+            self._servers.discard(server)
+
+    def _retire(self, server: PooledServer) -> None:
+        """Stop ``server`` and start its replacement in the background."""
+        server.stop.set()
+        if self._idle is not None and server.replacement is None:
+            self.recycled += 1
+            self._spawn()
+
+    async def _healthy(self, server: PooledServer) -> bool:
+        if time.monotonic() - server.last_used < self.ping_after:
+            return True
+        try:
+            await asyncio.wait_for(server.session.send_ping(), self.ping_timeout)
+            return True
+        except Exception:
+            self.failed_pings += 1
+            return False
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[ClientSession]:
+        """Lease an initialized session for the duration of the block."""
+        await self.start()
+        while True:
+            server = await self._idle.get()
+            if isinstance(server, Exception):
+                # Keep the pool at full size for the next caller
+                self._spawn()
+                raise ConnectionError(f"MCP server failed to start: {server}")
+            if server.replaced:
+                server.stop.set()
+                continue
+            if server.task.done() or not await self._healthy(server):
+                self._retire(server)
+                continue
+            break
+
+        failed = False
+        try:
+            yield server.session
+        except Exception:
+            failed = True
+            raise
+        finally:
+            server.calls += 1
+            server.last_used = time.monotonic()
+            if failed or self._idle is None:
+                self._retire(server)
+            else:
+                if server.calls >= self.max_calls and server.replacement is None:
+                    server.replacement = self._spawn()
+                    self.recycled += 1
+                if server.replaced:
+                    server.stop.set()
+                else:
+                    self._idle.put_nowait(server)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, None
+        if idle is None:
+            return
+        servers = list(self._servers)
+        for server in servers:
+            server.stop.set()
+        await asyncio.gather(
+            *(server.task for server in servers), return_exceptions=True
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.size,
+            "live": len(self._servers),
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "started": self.started,
+            "recycled": self.recycled,
+            "failed_pings": self.failed_pings,
+        }
+
+
+class PooledMCPTool(BaseTool):
+    """An MCP tool whose calls run on a session leased from a ``StdioServerPool``."""
+
+    def __init__(self, tool: Any, pool: StdioServerPool):
+        super().__init__(name=tool.name, description=tool.description or "")
+        self.input_schema = tool.inputSchema
+        self.pool = pool
+
+    def _get_declaration(self) -> types.FunctionDeclaration:
+        return types.FunctionDeclaration(
+            name=self.name,
+            description=self.description,
+            parameters_json_schema=self.input_schema,
+        )
+
+    async def run_async(self, *, args: Dict[str, Any], tool_context: Any) -> Any:
+        async with self.pool.session() as session:
+            result = await session.call_tool(self.name, arguments=args)
+        return result.model_dump(mode="json", exclude_none=True)
+
+
+class PooledMCPToolset(BaseToolset):
+    """Drop-in for ``MCPToolset`` over stdio that shares a warm server pool.
+
+    Every agent session using this toolset draws from the same pool instead
+    of spawning its own server process.
+    """
+
+    def __init__(
+        self,
+        connection_params: StdioServerParameters,
+        tool_filter: Optional[List[str]] = None,
+        **pool_options: Any,
+    ):
+        super().__init__()
+        self.pool = StdioServerPool(connection_params, **pool_options)
+        self.tool_filter = tool_filter
+        self._tools: Optional[List[BaseTool]] = None
+
+    async def get_tools(self, readonly_context: Any = None) -> List[BaseTool]:
+        if self._tools is None:
+            async with self.pool.session() as session:
+                listed = await session.list_tools()
+            self._tools = [
+                PooledMCPTool(tool, self.pool)
+                for tool in listed.tools
+                if not self.tool_filter or tool.name in self.tool_filter
+            ]
+        return self._tools
+
+    async def close(self) -> None:
+        await self.pool.close()
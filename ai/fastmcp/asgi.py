@@ -0,0 +1,60 @@
+"""Stateless streamable HTTP deployment of the SpaceX MCP server.
+
+Every request is handled on its own, with no session pinned to a worker, so
+any number of worker processes can sit behind one port and serve many
+agents across cores:
+
+    SPACEX_CACHE_BACKEND=sqlite uvicorn asgi:app --workers 4 --port 8000
+    gunicorn asgi:app -k uvicorn.workers.UvicornWorker -w 4 -b :8000
+    python asgi.py --workers 4 --port 8000
+
+Clients connect to http://HOST:PORT/mcp. With SPACEX_CACHE_BACKEND=sqlite
+the workers share one response cache file (SPACEX_CACHE_PATH); the default
+in-process cache is per worker.
+"""
+
+import argparse
+import os
+from contextlib import asynccontextmanager
+
+import uvicorn
+
+from server import lifespan, mcp
+
+# Without sessions there is no stream to resume, but responses still stream
+# as SSE so progress notifications reach the client during a call
+app = mcp.http_app(path="/mcp", stateless_http=True)
+_serve_requests = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def worker_lifespan(app):
+    """Hold the server's shared resources open for the life of the worker.
+
+    In stateless mode the MCP lifespan is entered and left once per request;
+    keeping one reference here stops the HTTP pool and mirror sync from being
+    torn down and rebuilt between requests.
+    """
+    async with lifespan(mcp), _serve_requests(app):
+        yield
+
+
+app.router.lifespan_context = worker_lifespan
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--log-level", default="warning")
+    args = parser.parse_args()
+    uvicorn.run(
+        "asgi:app",
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        log_level=args.log_level,
+    )
@@ -0,0 +1,29 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from fastmcp import Client
+from fastmcp.client.client import CallToolResult
+
+ToolCall = Tuple[str, Optional[Dict[str, Any]]]
+
+
+class BatchClient(Client):
+    """``fastmcp.Client`` that can send several tool calls at once."""
+
+    async def call_tools_batch(
+        self, calls: Sequence[ToolCall], raise_on_error: bool = True, **kwargs
+    ) -> List[Union[CallToolResult, Exception]]:
+        """Call every ``(name, arguments)`` pair over this one session.
+
+        All requests are written back-to-back without waiting for replies; the
+        MCP session matches each response to its request by id. Results come
+        back in the order of ``calls``, and a call that fails yields its
+        exception in its slot instead of failing the whole batch.
+        """
+        return await asyncio.gather(
+            *(
+                self.call_tool(name, arguments, raise_on_error=raise_on_error, **kwargs)
+                for name, arguments in calls
+            ),
+            return_exceptions=True,
+        )
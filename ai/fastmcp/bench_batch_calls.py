@@ -0,0 +1,83 @@
+"""Sequential tool calls vs call_tools_batch over in-memory and stdio transports.
+
+Runs offline against stub_spacex_api.py, which adds ``--latency`` seconds to
+every upstream response:
+
+    python bench_batch_calls.py --calls 20 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from fastmcp.client.transports import PythonStdioTransport
+
+from batch_client import BatchClient
+from stub_spacex_api import start_stub, stub_base_url
+
+SERVER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "server.py")
+
+
+def launch_calls(count: int):
+    # Distinct IDs so the server-side cache and coalescing can't help either side
+    return [
+        ("get_spacex_launch_by_id", {"launch_id": f"{i:024x}", "fields": ["name"]})
+        for i in range(1, count + 1)
+    ]
+
+
+async def ignore_logs(message) -> None:
+    # Rendering server log notifications would dominate the measurement
+    pass
+
+
+async def run(label: str, client: BatchClient, count: int, rounds: int) -> None:
+    calls = launch_calls(count)
+    async with client:
+        sequential = batched = 0.0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for name, arguments in calls:
+                await client.call_tool(name, arguments)
+            sequential += time.perf_counter() - start
+
+            start = time.perf_counter()
+            await client.call_tools_batch(calls)
+            batched += time.perf_counter() - start
+
+    total = count * rounds
+    print(
+        f"{label:<10} sequential {total / sequential:8.1f} calls/s   "
+        f"batched {total / batched:8.1f} calls/s   "
+        f"speed-up {sequential / batched:5.1f}x"
+    )
+
+
+async def main(count: int, rounds: int, latency: float) -> None:
+    runner = await start_stub(latency=latency)
+    base_url = stub_base_url(runner)
+    # The in-memory server reads the base URL at import time
+    os.environ["SPACEX_API_BASE_URL"] = base_url
+    from server import mcp
+
+    try:
+        await run("in-memory", BatchClient(mcp, log_handler=ignore_logs), count, rounds)
+        stdio = PythonStdioTransport(
+            SERVER_PATH,
+            python_cmd=sys.executable,
+            env={**os.environ, "SPACEX_API_BASE_URL": base_url},
+        )
+        await run("stdio", BatchClient(stdio, log_handler=ignore_logs), count, rounds)
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.02)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.rounds, args.latency))
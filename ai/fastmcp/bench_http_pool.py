@@ -0,0 +1,61 @@
+"""Compare a fresh aiohttp session per call with the pooled SpaceXHTTPClient.
+
+Runs fully offline against stub_spacex_api.py:
+
+    python bench_http_pool.py --calls 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+
+from http_client import SpaceXHTTPClient, create_ssl_context
+from stub_spacex_api import start_stub, stub_base_url
+
+
+async def fresh_session_call(base_url: str) -> None:
+    # What every tool used to do before the shared client existed
+    connector = aiohttp.TCPConnector(ssl=create_ssl_context())
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async with session.get(f"{base_url}/v5/launches/latest") as response:
+            await response.json()
+
+
+async def measure(label: str, call, calls: int) -> None:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await call()
+        timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(
+        f"{label:<16} mean {statistics.mean(timings):7.3f} ms  "
+        f"p50 {statistics.median(timings):7.3f} ms  p95 {p95:7.3f} ms"
+    )
+
+
+async def main(calls: int, latency: float) -> None:
+    runner = await start_stub(latency=latency)
+    base_url = stub_base_url(runner)
+    try:
+        await measure("fresh session", lambda: fresh_session_call(base_url), calls)
+        async with SpaceXHTTPClient(base_url=base_url) as client:
+            await measure(
+                "pooled client",
+                lambda: client.fetch_json("GET", "/v5/launches/latest"),
+                calls,
+            )
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.latency))
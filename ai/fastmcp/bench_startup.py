@@ -0,0 +1,131 @@
+"""Cold-start budget for the SpaceX MCP server over stdio.
+
+Profiles ``import server`` with ``python -X importtime`` and times how long a
+freshly spawned server takes to answer ``initialize``. Exits non-zero when a
+module that must stay lazy (aiohttp) is imported at start-up, and, when asked
+for, when readiness regresses:
+
+- median readiness exceeds ``--budget-ms``
+- median readiness is more than ``--tolerance`` slower than ``--baseline``
+
+Absolute readiness depends on the machine (``import fastmcp`` alone can take
+a second), so record a baseline where the check runs and compare to it:
+
+    python bench_startup.py --runs 10
+    python bench_startup.py --write-baseline startup_baseline.json
+    python bench_startup.py --baseline startup_baseline.json --tolerance 0.2
+    python bench_startup.py --budget-ms 1500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SERVER_PATH = os.path.join(HERE, "server.py")
+
+# Only needed once a tool actually calls the SpaceX API
+LAZY_MODULES = ("aiohttp",)
+
+
+def import_profile() -> List[Tuple[str, int, int, int]]:
+    """Return ``(module, depth, self_us, cumulative_us)`` for ``import server``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        modules.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return modules
+
+
+async def time_to_ready() -> float:
+    """Seconds from spawning the server to its reply to ``initialize``."""
+    params = StdioServerParameters(
+        command=sys.executable, args=[SERVER_PATH], cwd=HERE, env=dict(os.environ)
+    )
+    with open(os.devnull, "w") as devnull:
+        start = time.perf_counter()
+        async with stdio_client(params, errlog=devnull) as streams:
+            async with ClientSession(*streams) as session:
+                await session.initialize()
+                return time.perf_counter() - start
+
+
+async def main(args: argparse.Namespace) -> int:
+    modules = import_profile()
+    total_ms = next(cum for name, _, _, cum in modules if name == "server") / 1000
+    loaded = {name for name, _, _, _ in modules}
+    print(f"import server: {total_ms:.1f} ms")
+    print(f"  {'top-level import':<40} {'cumulative ms':>14}")
+    top = sorted((m for m in modules if m[1] == 1), key=lambda m: -m[3])
+    for name, _, _, cumulative in top[: args.top]:
+        print(f"  {name:<40} {cumulative / 1000:14.1f}")
+
+    # The first spawn also writes bytecode caches, so it is not counted
+    await time_to_ready()
+    ready = [await time_to_ready() for _ in range(args.runs)]
+    median_ms = statistics.median(ready) * 1000
+    print(
+        f"stdio readiness over {args.runs} runs: median {median_ms:.1f} ms, "
+        f"min {min(ready) * 1000:.1f} ms, max {max(ready) * 1000:.1f} ms"
+    )
+
+    report: Dict[str, Any] = {
+        "python": sys.version.split()[0],
+        "import_ms": total_ms,
+        "ready_median_ms": median_ms,
+    }
+    if args.write_baseline:
+        with open(args.write_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.write_baseline}")
+
+    failures = [
+        f"{name} is imported at start-up" for name in LAZY_MODULES if name in loaded
+    ]
+    if args.budget_ms is not None and median_ms > args.budget_ms:
+        failures.append(
+            f"readiness {median_ms:.1f} ms is over the {args.budget_ms} ms budget"
+        )
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["ready_median_ms"]
+        if median_ms > baseline * (1 + args.tolerance):
+            failures.append(
+                f"readiness {median_ms:.1f} ms regressed from {baseline:.1f} ms "
+                f"(tolerance {args.tolerance:.0%})"
+            )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10, help="imports to list")
+    parser.add_argument("--budget-ms", type=float, help="absolute readiness limit")
+    parser.add_argument("--baseline", help="JSON written by --write-baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--write-baseline", help="save this run's numbers here")
+    sys.exit(asyncio.run(main(parser.parse_args())))
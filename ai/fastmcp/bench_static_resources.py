@@ -0,0 +1,49 @@
+"""Per-read cost of the rockets resource before and after pre-serialization.
+
+python bench_static_resources.py --reads 2000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import timeit
+
+from fastmcp import Client
+
+from server import mcp, rockets_list, spacex_rockets
+
+
+def per_read_us(func, reads: int) -> float:
+    return timeit.timeit(func, number=reads) / reads * 1_000_000
+
+
+async def per_client_read_us(client: Client, uri: str, reads: int) -> float:
+    start = time.perf_counter()
+    for _ in range(reads):
+        await client.read_resource(uri)
+    return (time.perf_counter() - start) / reads * 1_000_000
+
+
+async def main(reads: int) -> None:
+    # What the resource used to do on every read: build the dict and serialize it
+    before = per_read_us(lambda: json.dumps(spacex_rockets(), indent=2), reads)
+    after = per_read_us(lambda: rockets_list.compact, reads)
+    print(f"serialize per read   {before:9.2f} us")
+    print(f"pre-serialized read  {after:9.2f} us")
+
+    uri = "spacex://rockets/list"
+    async with Client(mcp) as client:
+        full = await per_client_read_us(client, uri, reads)
+        conditional = await per_client_read_us(
+            client, f"{uri}/if-none-match/{rockets_list.etag}", reads
+        )
+    print(f"MCP read, full body  {full:9.2f} us  {len(rockets_list.compact)} bytes")
+    print(f"MCP read, not modified {conditional:7.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--reads", type=int, default=2000)
+    args = parser.parse_args()
+    asyncio.run(main(args.reads))
@@ -0,0 +1,284 @@
+import asyncio
+import json
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
+
+Loader = Callable[[], Awaitable[Tuple[int, Any]]]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Freshness rules for one upstream endpoint.
+
+    A cached response is served as-is for ``ttl`` seconds. For a further
+    ``stale_ttl`` seconds it is still served, but a background refresh is
+    started so the next caller gets fresh data.
+    """
+
+    ttl: float
+    stale_ttl: float = 0.0
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    stored_at: float
+
+    def age(self) -> float:
+        return time.monotonic() - self.stored_at
+
+
+class MemoryStore:
+    """Entries in this process, least recently used evicted first.
+
+    Values are shared between callers and must be treated as read-only.
+    """
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, value: Any, encoded: str) -> None:
+        self.delete(key)
+        self._entries[key] = CacheEntry(value, len(encoded), time.monotonic())
+        self.current_bytes += len(encoded)
+        while self.current_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.current_bytes -= evicted.size
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.current_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
+
+
+class SQLiteStore:
+    """Entries in a local SQLite file shared by every worker process.
+
+    Reads never write, so workers do not contend on hits; the oldest stored
+    entries are evicted first once the total size passes ``max_bytes``.
+    Each process opens its own connection on first use, which keeps the
+    store safe to create before a pre-forking server starts its workers.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_bytes: int = 64 * 1024 * 1024):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._db: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._pid != os.getpid():
+            self._db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "size INTEGER NOT NULL, stored_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_stored_at "
+                "ON responses (stored_at)"
+            )
+            self._pid = os.getpid()
+        return self._db
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        row = self.db.execute(
+            "SELECT value, size, stored_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, size, stored_at = row
+        # Stored as wall-clock time so every process agrees on an entry's age
+        age = time.time() - stored_at
+        return CacheEntry(json.loads(value), size, time.monotonic() - age)
+
+    def put(self, key: str, value: Any, encoded: str) -> None:
+        db = self.db
+        with db:
+            db.execute("BEGIN IMMEDIATE")
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, encoded, len(encoded), time.time()),
+            )
+            total = db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            while total > self.max_bytes:
+                oldest, size = db.execute(
+                    "SELECT key, size FROM responses ORDER BY stored_at LIMIT 1"
+                ).fetchone()
+                db.execute("DELETE FROM responses WHERE key = ?", (oldest,))
+                total -= size
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        self.db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self.db.execute("DELETE FROM responses")
+
+    def stats(self) -> Dict[str, Any]:
+        entries, size = self.db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return {
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "path": self.path,
+        }
+
+
+class ResponseCache:
+    """Cache of upstream JSON responses, bounded by size in bytes.
+
+    Entries live in ``store``: a ``MemoryStore`` by default, or a
+    ``SQLiteStore`` to share them between worker processes. Values returned
+    from a memory store are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024, store: Any = None):
+        self.store = store if store is not None else MemoryStore(max_bytes)
+        self._refreshing: Set[str] = set()
+        self._tasks: Set[asyncio.Task] = set()
+        self.hits = 0
+        self.stale_hits = 0
+        self.fallback_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @classmethod
+    def from_env(cls, max_bytes: int = 16 * 1024 * 1024) -> "ResponseCache":
+        """Build from SPACEX_CACHE_BACKEND (memory or sqlite) and SPACEX_CACHE_PATH."""
+        backend = os.getenv("SPACEX_CACHE_BACKEND", "memory")
+        if backend == "memory":
+            return cls(max_bytes)
+        if backend == "sqlite":
+            path = os.getenv("SPACEX_CACHE_PATH", "spacex_cache.sqlite3")
+            return cls(store=SQLiteStore(path, max_bytes))
+        raise ValueError(f"Unknown SPACEX_CACHE_BACKEND: {backend}")
+
+    async def get_or_fetch(
+        self, key: str, loader: Loader, policy: CachePolicy
+    ) -> Tuple[int, Any]:
+        """Return ``(status, data)`` for ``key``, calling ``loader`` on a miss.
+
+        Only ``200`` responses are stored. If the loader fails or the upstream
+        returns a 5xx, an expired entry for ``key`` is served instead when one
+        is still held; otherwise the error reaches the caller.
+        """
+        entry = self.store.get(key)
+        if entry is not None:
+            age = entry.age()
+            if age < policy.ttl:
+                self.hits += 1
+                return 200, entry.value
+            if age < policy.ttl + policy.stale_ttl:
+                self.stale_hits += 1
+                self._refresh_in_background(key, loader, policy)
+                return 200, entry.value
+
+        self.misses += 1
+        try:
+            status, data = await loader()
+        except Exception:
+            if entry is None:
+                raise
+            # Upstream down or circuit open: an old answer beats no answer
+            self.fallback_hits += 1
+            return 200, entry.value
+        if status == 200:
+            self.set(key, data, policy)
+        elif status >= 500 and entry is not None:
+            self.fallback_hits += 1
+            return 200, entry.value
+        return status, data
+
+    def set(self, key: str, value: Any, policy: CachePolicy) -> None:
+        encoded = json.dumps(value, separators=(",", ":"))
+        if len(encoded) > self.store.max_bytes:
+            return
+        self.store.put(key, value, encoded)
+
+    def invalidate(self, key: str) -> None:
+        self.store.delete(key)
+
+    def clear(self) -> None:
+        self.store.clear()
+
+    def _refresh_in_background(
+        self, key: str, loader: Loader, policy: CachePolicy
+    ) -> None:
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+        task = asyncio.create_task(self._refresh(key, loader, policy))
+        # Hold a reference so the task is not garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _refresh(self, key: str, loader: Loader, policy: CachePolicy) -> None:
+        try:
+            status, data = await loader()
+            if status == 200:
+                self.set(key, data, policy)
+                self.refreshes += 1
+            else:
+                self.refresh_errors += 1
+        except Exception:
+            # Keep serving the stale entry; the next stale hit retries
+            self.refresh_errors += 1
+        finally:
+            self._refreshing.discard(key)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.stale_hits + self.misses
+        return {
+            "backend": self.store.name,
+            **self.store.stats(),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "fallback_hits": self.fallback_hits,
+            "misses": self.misses,
+            "hit_ratio": (self.hits + self.stale_hits) / lookups if lookups else 0.0,
+            "background_refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -0,0 +1,23 @@
+from typing import Any, Dict, Optional, Tuple
+
+# Key in a tool's or resource's ``meta`` that declares its results cacheable
+CACHE_META_KEY = "cache"
+
+# Every SpaceX tool only reads upstream data
+READ_ONLY = {"readOnlyHint": True, "idempotentHint": True}
+
+
+def cacheable(ttl: Optional[float] = None) -> Dict[str, Any]:
+    """``meta`` letting clients reuse a result for ``ttl`` seconds.
+
+    ``ttl=None`` declares the tool or resource pure: the same arguments always
+    give the same result, so it can be kept until explicitly invalidated.
+    """
+    return {CACHE_META_KEY: {"ttl": ttl}}
+
+
+def cache_policy(meta: Optional[Dict[str, Any]]) -> Tuple[bool, Optional[float]]:
+    """Read ``(cacheable, ttl)`` back out of a listed tool's or resource's meta."""
+    if not meta or CACHE_META_KEY not in meta:
+        return False, None
+    return True, meta[CACHE_META_KEY].get("ttl")
@@ -4,11 +4,12 @@ import logging
 from server import mcp
 
 
-from fastmcp import Client
-
-
 from fastmcp.client.logging import LogMessage
 
+from batch_client import BatchClient
+from discovery import ManifestCache
+from result_cache import ClientResultCache
+
 logger = logging.getLogger("fastmcp.client")
 
 logging.basicConfig(
@@ -22,7 +23,9 @@ async def log_handler(message: LogMessage):
     log.log(level, message.data)
 
 
-client = Client(mcp, log_handler=log_handler)
+client = BatchClient(mcp, log_handler=log_handler)
+manifest_cache = ManifestCache()
+result_cache = ClientResultCache(client)
 
 
 async def main():
@@ -32,19 +35,16 @@ async def main():
     try:
         async with client:
             logger.info("Client connected successfully")
-            logger.debug("Sending ping to server")
-            await client.ping()
-            logger.info("Server ping successful")
-
-            logger.debug("Fetching available tools")
-            tools = await client.list_tools()
-            logger.info(f"Retrieved {len(tools) if tools else 0}")
-
-            resources = await client.list_resources()
-            logger.info(f"Retrieved {len(resources) if resources else 0}")
-
-            prompts = await client.list_prompts()
-            logger.info(f"Retrieved {len(prompts) if prompts else 0}")
+            logger.debug("Discovering server capabilities")
+            manifest = await manifest_cache.discover(client)
+            result_cache.load_policies(manifest)
+            tools = manifest.tools
+            resources = manifest.resources
+            prompts = manifest.prompts
+            source = "cache" if manifest.from_cache else "server"
+            logger.info(f"Retrieved {len(tools)} tools from {source}")
+            logger.info(f"Retrieved {len(resources)} resources from {source}")
+            logger.info(f"Retrieved {len(prompts)} prompts from {source}")
 
             logger.info(f"Available tools: {tools}")
             logger.info("-" * 180)
@@ -53,9 +53,23 @@ async def main():
             logger.info(f"Available prompts: {prompts}")
             logger.info("-" * 180)
 
-            result = await client.call_tool("get_latest_spacex_launch")
+            # Served locally on repeat calls within the TTL the server declared
+            result = await result_cache.call_tool("get_latest_spacex_launch")
             logger.info(f"Tool execution result: {result}")
 
+            # Independent calls go out together over the same session
+            batch = [
+                ("get_upcoming_spacex_launches", {"fields": ["name", "date_utc"]}),
+                ("search_spacex_launches", {"rocket_name": "falcon9", "limit": 5}),
+                ("get_latest_spacex_launch", {"fields": ["name", "success"]}),
+            ]
+            results = await client.call_tools_batch(batch)
+            for (name, _), batch_result in zip(batch, results):
+                if isinstance(batch_result, Exception):
+                    logger.error(f"Batched call {name} failed: {batch_result}")
+                else:
+                    logger.info(f"Batched call {name} result: {batch_result}")
+
     except Exception as e:
         logger.error(f"Error during client execution: {e}", exc_info=True)
         raise
@@ -0,0 +1,134 @@
+import asyncio
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+import mcp.types
+from fastmcp import Client
+
+logger = logging.getLogger("fastmcp.client.discovery")
+
+MANIFEST_CACHE_PATH = os.getenv(
+    "MCP_MANIFEST_CACHE",
+    os.path.join(os.path.expanduser("~"), ".cache", "fastmcp", "manifests.json"),
+)
+
+
+@dataclass
+class CapabilityManifest:
+    """Everything a client learns about a server during discovery."""
+
+    server_key: str
+    tools: List[mcp.types.Tool]
+    resources: List[mcp.types.Resource]
+    templates: List[mcp.types.ResourceTemplate]
+    prompts: List[mcp.types.Prompt]
+    from_cache: bool = False
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "tools": [tool.model_dump(mode="json") for tool in self.tools],
+            "resources": [res.model_dump(mode="json") for res in self.resources],
+            "templates": [tmpl.model_dump(mode="json") for tmpl in self.templates],
+            "prompts": [prompt.model_dump(mode="json") for prompt in self.prompts],
+        }
+
+    @classmethod
+    def from_json(cls, server_key: str, data: Dict[str, Any]) -> "CapabilityManifest":
+        return cls(
+            server_key=server_key,
+            tools=[mcp.types.Tool.model_validate(t) for t in data["tools"]],
+            resources=[mcp.types.Resource.model_validate(r) for r in data["resources"]],
+            templates=[
+                mcp.types.ResourceTemplate.model_validate(t)
+                for t in data.get("templates", [])
+            ],
+            prompts=[mcp.types.Prompt.model_validate(p) for p in data["prompts"]],
+            from_cache=True,
+        )
+
+
+def server_key(client: Client) -> str:
+    """Identify the connected server by the name and version it reported."""
+    info = client.initialize_result.serverInfo
+    return f"{info.name}@{info.version}"
+
+
+class ManifestCache:
+    """Capability manifests on disk, keyed by server name and version.
+
+    Short-lived agent processes reconnect often; reusing the manifest from a
+    previous run skips the discovery round-trips when the server is unchanged.
+    """
+
+    def __init__(self, path: str = MANIFEST_CACHE_PATH):
+        self.path = path
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _load_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[CapabilityManifest]:
+        data = self._load_all().get(key)
+        return CapabilityManifest.from_json(key, data) if data else None
+
+    def put(self, manifest: CapabilityManifest) -> None:
+        manifests = self._load_all()
+        manifests[manifest.server_key] = manifest.to_json()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        # Write then rename so a concurrent reader never sees a partial file
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifests, f)
+        os.replace(tmp_path, self.path)
+
+    async def discover(
+        self, client: Client, revalidate: bool = True
+    ) -> CapabilityManifest:
+        """Return the manifest for the connected server.
+
+        A cached manifest for the same server version is returned at once and,
+        with ``revalidate``, refreshed in the background while the session is
+        open. Otherwise discovery runs and its result is cached.
+        """
+        key = server_key(client)
+        cached = self.get(key)
+        if cached is None:
+            manifest = await fetch_manifest(client)
+            self.put(manifest)
+            return manifest
+
+        logger.info(f"Using cached capability manifest for {key}")
+        if revalidate:
+            task = asyncio.create_task(self._revalidate(client, cached))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return cached
+
+    async def _revalidate(self, client: Client, cached: CapabilityManifest) -> None:
+        try:
+            manifest = await fetch_manifest(client)
+        except Exception as e:
+            logger.debug(f"Manifest revalidation failed: {e}")
+            return
+        if manifest.to_json() != cached.to_json():
+            logger.info(f"Capability manifest for {manifest.server_key} changed")
+            self.put(manifest)
+
+
+async def fetch_manifest(client: Client) -> CapabilityManifest:
+    """Ping and list every capability concurrently on one session."""
+    _, tools, resources, templates, prompts = await asyncio.gather(
+        client.ping(),
+        client.list_tools(),
+        client.list_resources(),
+        client.list_resource_templates(),
+        client.list_prompts(),
+    )
+    return CapabilityManifest(server_key(client), tools, resources, templates, prompts)
@@ -0,0 +1,197 @@
+import asyncio
+import json as jsonlib
+import os
+import ssl
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from metrics import upstream_timer
+from resilience import CircuitBreaker, EndpointTimeout, RetryPolicy
+
+if TYPE_CHECKING:
+    import aiohttp
+
+SPACEX_API_BASE_URL = os.getenv("SPACEX_API_BASE_URL", "https://api.spacexdata.com")
+
+
+def create_ssl_context():
+    """Create an SSL context that bypasses certificate verification."""
+    ssl_context = ssl.create_default_context()
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+class SpaceXHTTPClient:
+    """Server-lifetime HTTP client shared by every SpaceX tool and resource.
+
+    One ``ClientSession`` backed by one keep-alive ``TCPConnector`` is opened
+    when the first user enters the client and closed when the last one leaves,
+    so TCP and TLS handshakes are paid once per pooled connection instead of
+    once per tool call.
+
+    Concurrent identical requests (same method, path and body) are coalesced
+    into a single upstream request whose result or error every caller shares.
+
+    Every request has a timeout (``endpoint_timeouts`` overrides ``timeout``
+    for exact paths), GETs are retried with jittered backoff on connection errors,
+    timeouts and 5xx/429 responses, and a circuit breaker fails fast with
+    ``CircuitOpenError`` while the upstream keeps failing.
+
+    aiohttp is imported and the session opened on the first request rather
+    than on entry, so a server process that is started but never asked for
+    SpaceX data does not pay for either.
+    """
+
+    def __init__(
+        self,
+        base_url: str = SPACEX_API_BASE_URL,
+        limit: int = 100,
+        limit_per_host: int = 20,
+        keepalive_timeout: float = 30.0,
+        dns_cache_ttl: int = 300,
+        timeout: EndpointTimeout = EndpointTimeout(),
+        endpoint_timeouts: Optional[Dict[str, EndpointTimeout]] = None,
+        retry: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self.timeout = timeout
+        self.endpoint_timeouts = endpoint_timeouts or {}
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._users = 0
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.coalesced = 0
+        self.requests = 0
+        self.retries = 0
+        self.timeouts = 0
+        self.failures = 0
+
+    async def __aenter__(self) -> "SpaceXHTTPClient":
+        self._users += 1
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._users -= 1
+        if self._users == 0:
+            await self.close()
+
+    async def start(self) -> None:
+        """Open the pooled session if it is not already open."""
+        if self._session is not None and not self._session.closed:
+            return
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            ssl=create_ssl_context(),
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        self._session = aiohttp.ClientSession(
+            base_url=self.base_url,
+            connector=connector,
+            # HTTP/1.1 so every connection is persistent and reused by the pool
+            version=aiohttp.HttpVersion11,
+        )
+
+    async def close(self) -> None:
+        """Close the pooled session and every connection it holds."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            raise RuntimeError("SpaceXHTTPClient has not been started")
+        return self._session
+
+    async def fetch_json(
+        self, method: str, path: str, json: Any = None
+    ) -> Tuple[int, Any]:
+        """Send a request through the pool and return ``(status, parsed JSON)``.
+
+        The body is only parsed for ``200`` responses; any other status is
+        returned with ``None`` so callers can report it. The parsed JSON may be
+        shared with concurrent callers and must be treated as read-only.
+        """
+        key = f"{method} {path} {jsonlib.dumps(json, sort_keys=True)}"
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._request(method, path, json))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller does not cancel the request for the rest
+        with upstream_timer():
+            return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        # Mark the error as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def timeout_for(self, path: str) -> "aiohttp.ClientTimeout":
+        import aiohttp
+
+        timeout = self.endpoint_timeouts.get(path, self.timeout)
+        return aiohttp.ClientTimeout(
+            total=timeout.total, connect=timeout.connect, sock_read=timeout.read
+        )
+
+    async def _request(self, method: str, path: str, json: Any) -> Tuple[int, Any]:
+        import aiohttp
+
+        attempts = self.retry.attempts if method == "GET" else 1
+        for attempt in range(1, attempts + 1):
+            self.breaker.before_call()
+            try:
+                status, data = await self._send(method, path, json)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if isinstance(e, asyncio.TimeoutError):
+                    self.timeouts += 1
+                self.failures += 1
+                self.breaker.record_failure()
+                if attempt == attempts:
+                    raise
+            else:
+                if status < 500 and status != 429:
+                    self.breaker.record_success()
+                    return status, data
+                self.failures += 1
+                self.breaker.record_failure()
+                if attempt == attempts:
+                    return status, data
+            self.retries += 1
+            await asyncio.sleep(self.retry.delay(attempt))
+
+    async def _send(self, method: str, path: str, json: Any) -> Tuple[int, Any]:
+        # Tools may be called outside the server lifespan (e.g. direct imports)
+        await self.start()
+        self.requests += 1
+        async with self.session.request(
+            method, path, json=json, timeout=self.timeout_for(path)
+        ) as response:
+            if response.status == 200:
+                return response.status, await response.json()
+            return response.status, None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "coalesced": self.coalesced,
+            "retries": self.retries,
+            "timeouts": self.timeouts,
+            "failures": self.failures,
+            "circuit": self.breaker.stats(),
+        }
@@ -0,0 +1,153 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Loader = Callable[[], Awaitable[Tuple[int, Any]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS launches (
+    id TEXT PRIMARY KEY,
+    date_utc TEXT,
+    rocket TEXT,
+    success INTEGER,
+    has_patch INTEGER NOT NULL,
+    doc TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS launches_rocket ON launches (rocket, date_utc);
+CREATE INDEX IF NOT EXISTS launches_success ON launches (success, date_utc);
+CREATE INDEX IF NOT EXISTS launches_has_patch ON launches (has_patch, date_utc);
+CREATE INDEX IF NOT EXISTS launches_date ON launches (date_utc);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL
+);
+"""
+
+
+def _row(launch: Dict[str, Any]) -> Tuple[Any, ...]:
+    patch = (launch.get("links") or {}).get("patch") or {}
+    success = launch.get("success")
+    return (
+        launch["id"],
+        launch.get("date_utc"),
+        launch.get("rocket"),
+        None if success is None else int(success),
+        int(patch.get("small") is not None),
+        json.dumps(launch, separators=(",", ":")),
+    )
+
+
+class LaunchMirror:
+    """On-disk SQLite copy of every SpaceX launch, kept fresh by a periodic sync.
+
+    The search filters are answered from indexed columns, so queries never
+    touch the network. ``synced_at`` is the watermark of the last full sync.
+    """
+
+    def __init__(self, path: str, loader: Loader, sync_interval: float = 600.0):
+        self.path = path
+        self.loader = loader
+        self.sync_interval = sync_interval
+        # WAL lets reads on the event loop proceed while a sync writes
+        self._db = sqlite3.connect(path)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+        self._lock = asyncio.Lock()
+        self._sync_task: Optional[asyncio.Task] = None
+        self._users = 0
+
+    async def __aenter__(self) -> "LaunchMirror":
+        self._users += 1
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_forever())
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._users -= 1
+        if self._users == 0 and self._sync_task is not None:
+            self._sync_task.cancel()
+            self._sync_task = None
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        row = self._db.execute(
+            "SELECT value FROM sync_state WHERE key = 'synced_at'"
+        ).fetchone()
+        return row[0] if row else None
+
+    async def sync(self) -> int:
+        """Replace the mirror with a fresh bulk download and return its size."""
+        async with self._lock:
+            status, launches = await self.loader()
+            if status != 200:
+                raise RuntimeError(f"Mirror sync failed: HTTP {status}")
+            await asyncio.to_thread(self._replace_all, launches)
+            return len(launches)
+
+    def _replace_all(self, launches: List[Dict[str, Any]]) -> None:
+        rows = [_row(launch) for launch in launches]
+        # Own connection and one transaction, so reads on the event loop see
+        # either the old or the new snapshot, never a half-written one
+        db = sqlite3.connect(self.path)
+        try:
+            with db:
+                db.execute("DELETE FROM launches")
+                db.executemany("INSERT INTO launches VALUES (?, ?, ?, ?, ?, ?)", rows)
+                db.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES ('synced_at', ?)",
+                    (time.time(),),
+                )
+        finally:
+            db.close()
+
+    async def _sync_forever(self) -> None:
+        while True:
+            try:
+                count = await self.sync()
+                logger.info(f"Launch mirror synced {count} launches")
+            except Exception as e:
+                logger.warning(f"Launch mirror sync failed: {e}")
+            await asyncio.sleep(self.sync_interval)
+
+    def search(
+        self,
+        rocket: Optional[str] = None,
+        has_patch: Optional[bool] = None,
+        success: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Return matching launches, newest first, with the freshness watermark."""
+        clauses, params = [], []
+        if rocket:
+            clauses.append("rocket = ?")
+            params.append(rocket)
+        if has_patch is not None:
+            clauses.append("has_patch = ?")
+            params.append(int(has_patch))
+        if success is not None:
+            clauses.append("success = ?")
+            params.append(int(success))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        total = self._db.execute(
+            f"SELECT COUNT(*) FROM launches {where}", params
+        ).fetchone()[0]
+        sql = f"SELECT doc FROM launches {where} ORDER BY date_utc DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        docs = [json.loads(doc) for (doc,) in self._db.execute(sql, params)]
+
+        synced_at = self.synced_at
+        return {
+            "docs": docs,
+            "totalDocs": total,
+            "source": "mirror",
+            "synced_at": synced_at,
+            "age_seconds": None if synced_at is None else time.time() - synced_at,
+        }
@@ -0,0 +1,312 @@
+"""Load test for the SpaceX MCP server, fully offline.
+
+Starts stub_spacex_api.py with the requested upstream latency and payload
+size, then drives N concurrent fastmcp.Client sessions against the server over
+the in-memory, stdio and/or streamable HTTP transports. Every session runs the
+same fixed workload, so runs are comparable. Reports p50/p95/p99 latency per
+tool and resource, overall throughput, errors and server RSS:
+
+    python load_test.py --transport all --sessions 8 --iterations 20
+    python load_test.py --transport http --latency 0.05 --json report.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import socket
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import Client
+from fastmcp.client.transports import PythonStdioTransport
+
+from stub_spacex_api import start_stub, stub_base_url
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SERVER_PATH = os.path.join(HERE, "server.py")
+
+# (kind, name or URI, arguments) -- one iteration of every session's workload
+WORKLOAD: List[Tuple[str, str, Optional[Dict[str, Any]]]] = [
+    ("tool", "get_latest_spacex_launch", None),
+    ("tool", "get_upcoming_spacex_launches", None),
+    ("tool", "get_spacex_launch_by_id", {"launch_id": f"{7:024x}"}),
+    ("tool", "search_spacex_launches", {"rocket_name": "falcon9", "limit": 10}),
+    (
+        "tool",
+        "get_spacex_launches_by_ids",
+        {"ids": [f"{i:024x}" for i in range(1, 21)]},
+    ),
+    ("resource", "spacex://launches/latest", None),
+    ("resource", f"spacex://launches/{9:024x}", None),
+    ("resource", "spacex://rockets/list", None),
+]
+
+
+async def ignore_logs(message) -> None:
+    pass
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def rss_mb(pid: int) -> Optional[float]:
+    """Resident set size of ``pid`` from /proc (Linux only)."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        return None
+    return None
+
+
+def child_pids() -> List[int]:
+    pids = []
+    for entry in os.listdir("/proc") if os.path.isdir("/proc") else []:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # Field 4 is the parent pid; the command name may contain spaces
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == os.getpid():
+            pids.append(int(entry))
+    return pids
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_session(
+    client: Client,
+    iterations: int,
+    connected: asyncio.Barrier,
+    timings: Dict[str, List[float]],
+    errors: Dict,
+) -> None:
+    async with client:
+        # Start the clock only once every session is connected, so server
+        # process startup is not counted as request latency
+        await connected.wait()
+        for _ in range(iterations):
+            for kind, target, arguments in WORKLOAD:
+                start = time.perf_counter()
+                try:
+                    if kind == "tool":
+                        result = await client.call_tool(target, arguments)
+                        if isinstance(result.structured_content, dict) and (
+                            "error" in result.structured_content
+                        ):
+                            errors[target] += 1
+                    else:
+                        contents = await client.read_resource(target)
+                        if contents[0].text.startswith("Error:"):
+                            errors[target] += 1
+                except Exception:
+                    errors[target] += 1
+                timings[target].append((time.perf_counter() - start) * 1000)
+
+
+async def drive(
+    transport: str, clients: List[Client], iterations: int, server_pids: List[int]
+) -> Dict[str, Any]:
+    timings: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    connected = asyncio.Barrier(len(clients) + 1)
+    sessions = asyncio.gather(
+        *(
+            run_session(client, iterations, connected, timings, errors)
+            for client in clients
+        )
+    )
+    # A session that fails to connect surfaces through ``sessions``
+    await asyncio.wait(
+        [asyncio.ensure_future(connected.wait()), sessions],
+        return_when=asyncio.FIRST_COMPLETED,
+    )
+    start = time.perf_counter()
+    await sessions
+    elapsed = time.perf_counter() - start
+
+    if transport == "memory":
+        # ru_maxrss is KiB on Linux; the server shares this process
+        server_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    else:
+        server_rss = sum(rss_mb(pid) or 0.0 for pid in server_pids) or None
+
+    operations = {}
+    for target, values in timings.items():
+        values.sort()
+        operations[target] = {
+            "calls": len(values),
+            "errors": errors[target],
+            "p50_ms": percentile(values, 50),
+            "p95_ms": percentile(values, 95),
+            "p99_ms": percentile(values, 99),
+        }
+    calls = sum(len(values) for values in timings.values())
+    return {
+        "transport": transport,
+        "sessions": len(clients),
+        "calls": calls,
+        "errors": sum(errors.values()),
+        "seconds": elapsed,
+        "throughput_per_s": calls / elapsed,
+        "server_rss_mb": server_rss,
+        "operations": operations,
+    }
+
+
+async def run_memory(sessions: int, iterations: int) -> Dict[str, Any]:
+    from server import mcp
+
+    clients = [Client(mcp, log_handler=ignore_logs) for _ in range(sessions)]
+    return await drive("memory", clients, iterations, [])
+
+
+async def run_stdio(sessions: int, iterations: int, env: Dict[str, str]) -> Dict:
+    clients = [
+        Client(
+            PythonStdioTransport(SERVER_PATH, python_cmd=sys.executable, env=env),
+            log_handler=ignore_logs,
+        )
+        for _ in range(sessions)
+    ]
+    # Each session has its own server process; track their combined peak RSS
+    peak_rss = 0.0
+
+    async def sample_rss():
+        nonlocal peak_rss
+        while True:
+            total = sum(rss_mb(pid) or 0.0 for pid in child_pids())
+            peak_rss = max(peak_rss, total)
+            await asyncio.sleep(0.2)
+
+    sampler = asyncio.create_task(sample_rss())
+    try:
+        report = await drive("stdio", clients, iterations, [])
+    finally:
+        sampler.cancel()
+    report["server_rss_mb"] = peak_rss or None
+    return report
+
+
+async def run_http(sessions: int, iterations: int, env: Dict[str, str]) -> Dict:
+    port = free_port()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "from server import mcp; "
+            f"mcp.run(transport='http', host='127.0.0.1', port={port}, "
+            "log_level='warning')",
+        ],
+        cwd=HERE,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        await wait_for_port(port)
+        url = f"http://127.0.0.1:{port}/mcp"
+        clients = [Client(url, log_handler=ignore_logs) for _ in range(sessions)]
+        return await drive("http", clients, iterations, [server.pid])
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def wait_for_port(port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.1)
+    raise TimeoutError(f"Server did not listen on port {port} within {timeout}s")
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    rss = report["server_rss_mb"]
+    print(
+        f"\n[{report['transport']}] {report['sessions']} sessions, "
+        f"{report['calls']} calls in {report['seconds']:.2f}s = "
+        f"{report['throughput_per_s']:.1f} calls/s, {report['errors']} errors, "
+        f"server RSS {'n/a' if rss is None else f'{rss:.1f} MB'}"
+    )
+    print(f"  {'operation':<52} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'err':>4}")
+    for target, stats in report["operations"].items():
+        print(
+            f"  {target:<52} {stats['p50_ms']:8.2f} {stats['p95_ms']:8.2f} "
+            f"{stats['p99_ms']:8.2f} {stats['errors']:4d}"
+        )
+
+
+async def main(args: argparse.Namespace) -> None:
+    runner = await start_stub(
+        launch_count=args.launches, latency=args.latency, padding=args.padding
+    )
+    base_url = stub_base_url(runner)
+    env = {**os.environ, "SPACEX_API_BASE_URL": base_url}
+    # The in-memory server reads the base URL when it is imported
+    os.environ["SPACEX_API_BASE_URL"] = base_url
+
+    transports = (
+        ["memory", "stdio", "http"] if args.transport == "all" else [args.transport]
+    )
+    reports = []
+    try:
+        for transport in transports:
+            if transport == "memory":
+                report = await run_memory(args.sessions, args.iterations)
+            elif transport == "stdio":
+                report = await run_stdio(args.sessions, args.iterations, env)
+            else:
+                report = await run_http(args.sessions, args.iterations, env)
+            print_report(report)
+            reports.append(report)
+    finally:
+        await runner.cleanup()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"config": vars(args), "reports": reports}, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--transport", choices=["memory", "stdio", "http", "all"], default="all"
+    )
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument("--iterations", type=int, default=10)
+    parser.add_argument("--launches", type=int, default=200)
+    parser.add_argument(
+        "--latency", type=float, default=0.01, help="upstream latency in seconds"
+    )
+    parser.add_argument(
+        "--padding", type=int, default=0, help="extra bytes per launch document"
+    )
+    parser.add_argument("--json", help="also write the report to this file")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,296 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from fastmcp.resources.template import build_regex
+from fastmcp.server.middleware import Middleware
+
+# Upper bounds in seconds of the wall time histogram buckets, the same as in
+# ai/mcp/metrics.py so both servers' histograms can be aggregated
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class CallTiming:
+    """Time spent in the upstream and in serialization during one call."""
+
+    upstream: float = 0.0
+    serialization: float = 0.0
+
+
+# The call being timed in the current task, if any. Tasks started during a
+# call copy the context, so their upstream time is counted towards it too.
+_current_call: ContextVar[Optional[CallTiming]] = ContextVar(
+    "current_call", default=None
+)
+
+
+@contextmanager
+def upstream_timer() -> Iterator[None]:
+    """Count the time spent in the block as upstream time of the current call."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        call = _current_call.get()
+        if call is not None:
+            call.upstream += time.perf_counter() - start
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """Count the time spent in the block as serialization time of the current call."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        call = _current_call.get()
+        if call is not None:
+            call.serialization += time.perf_counter() - start
+
+
+@dataclass
+class OperationMetrics:
+    """Running totals for one tool, resource or prompt."""
+
+    calls: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    max_wall_seconds: float = 0.0
+    upstream_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    payload_bytes: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    # Most recent wall times, for percentiles that follow the current load
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def record(
+        self, wall: float, timing: CallTiming, payload_bytes: int, error: bool
+    ) -> None:
+        self.calls += 1
+        self.errors += error
+        self.wall_seconds += wall
+        self.max_wall_seconds = max(self.max_wall_seconds, wall)
+        self.upstream_seconds += timing.upstream
+        self.serialization_seconds += timing.serialization
+        self.payload_bytes += payload_bytes
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if wall <= bound:
+                self.buckets[i] += 1
+                break
+        self.recent.append(wall)
+
+    def percentile(self, pct: float) -> float:
+        """Nearest-rank percentile of the recent wall times, in seconds."""
+        if not self.recent:
+            return 0.0
+        values = sorted(self.recent)
+        rank = max(1, round(pct / 100 * len(values)))
+        return values[min(rank, len(values)) - 1]
+
+    def to_json(self) -> Dict[str, Any]:
+        calls = self.calls or 1
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wall_ms_total": self.wall_seconds * 1000,
+            "wall_ms_mean": self.wall_seconds / calls * 1000,
+            "wall_ms_max": self.max_wall_seconds * 1000,
+            "wall_ms_p50": self.percentile(50) * 1000,
+            "wall_ms_p95": self.percentile(95) * 1000,
+            "wall_ms_p99": self.percentile(99) * 1000,
+            "upstream_ms_mean": self.upstream_seconds / calls * 1000,
+            "serialization_ms_mean": self.serialization_seconds / calls * 1000,
+            "payload_bytes_total": self.payload_bytes,
+            "payload_bytes_mean": self.payload_bytes / calls,
+        }
+
+
+class MetricsRegistry:
+    """Per-operation call metrics, keyed by kind ("tool", "resource", "prompt") and name."""
+
+    def __init__(self, prefix: str = "mcp"):
+        self.prefix = prefix
+        self.started_at = time.time()
+        self._operations: Dict[Tuple[str, str], OperationMetrics] = {}
+
+    def record(
+        self,
+        kind: str,
+        name: str,
+        wall: float,
+        timing: CallTiming,
+        payload_bytes: int,
+        error: bool,
+    ) -> None:
+        operation = self._operations.get((kind, name))
+        if operation is None:
+            operation = self._operations[(kind, name)] = OperationMetrics()
+        operation.record(wall, timing, payload_bytes, error)
+
+    def clear(self) -> None:
+        self._operations.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All operations, slowest total wall time first."""
+        ranked = sorted(
+            self._operations.items(), key=lambda item: -item[1].wall_seconds
+        )
+        return {
+            "uptime_seconds": time.time() - self.started_at,
+            "operations": [
+                {"kind": kind, "name": name, **operation.to_json()}
+                for (kind, name), operation in ranked
+            ],
+        }
+
+    def prometheus(self) -> str:
+        """Render every operation in the Prometheus text exposition format."""
+        p = self.prefix
+        counters = [
+            ("calls_total", "counter", "Calls handled", lambda m: m.calls),
+            ("errors_total", "counter", "Calls that failed", lambda m: m.errors),
+            (
+                "upstream_seconds_total",
+                "counter",
+                "Time spent waiting on upstream requests",
+                lambda m: m.upstream_seconds,
+            ),
+            (
+                "serialization_seconds_total",
+                "counter",
+                "Time spent serializing results",
+                lambda m: m.serialization_seconds,
+            ),
+            (
+                "payload_bytes_total",
+                "counter",
+                "Size of the returned content",
+                lambda m: m.payload_bytes,
+            ),
+        ]
+        lines = []
+        for suffix, metric_type, help_text, value in counters:
+            lines.append(f"# HELP {p}_{suffix} {help_text}")
+            lines.append(f"# TYPE {p}_{suffix} {metric_type}")
+            for (kind, name), operation in self._operations.items():
+                labels = _labels(kind, name)
+                lines.append(f"{p}_{suffix}{{{labels}}} {value(operation)}")
+
+        lines.append(f"# HELP {p}_duration_seconds Wall time per call")
+        lines.append(f"# TYPE {p}_duration_seconds histogram")
+        for (kind, name), operation in self._operations.items():
+            labels = _labels(kind, name)
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, operation.buckets):
+                cumulative += count
+                lines.append(
+                    f'{p}_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'{p}_duration_seconds_bucket{{{labels},le="+Inf"}} {operation.calls}'
+            )
+            lines.append(
+                f"{p}_duration_seconds_sum{{{labels}}} {operation.wall_seconds}"
+            )
+            lines.append(f"{p}_duration_seconds_count{{{labels}}} {operation.calls}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(kind: str, name: str) -> str:
+    escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+    return f'kind="{kind}",name="{escaped}"'
+
+
+def payload_bytes(value: Any) -> int:
+    """Size of the text and binary content in a tool, resource or prompt result."""
+    if isinstance(value, str):
+        return len(value) if value.isascii() else len(value.encode())
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(payload_bytes(item) for item in value)
+    if isinstance(value, dict):
+        # Structured output, which repeats the text content already counted
+        return 0
+    for attr in ("text", "blob", "content", "messages"):
+        inner = getattr(value, attr, None)
+        if inner is not None:
+            return payload_bytes(inner)
+    return 0
+
+
+class MetricsMiddleware(Middleware):
+    """Time every tool call, resource read and prompt render into ``registry``.
+
+    Resources read through a template are recorded under the template, so a
+    launch ID in the URI does not create a new series per launch.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self.registry = registry
+        self._static = set()
+        self._templates = None
+
+    async def on_call_tool(self, context, call_next):
+        return await self._timed("tool", context.message.name, context, call_next)
+
+    async def on_read_resource(self, context, call_next):
+        name = await self._resource_name(context)
+        return await self._timed("resource", name, context, call_next)
+
+    async def on_get_prompt(self, context, call_next):
+        return await self._timed("prompt", context.message.name, context, call_next)
+
+    async def _timed(self, kind: str, name: str, context, call_next) -> Any:
+        timing = CallTiming()
+        token = _current_call.set(timing)
+        start = time.perf_counter()
+        error = True
+        result = None
+        try:
+            result = await call_next(context)
+            error = _is_error(result)
+            return result
+        finally:
+            _current_call.reset(token)
+            self.registry.record(
+                kind,
+                name,
+                time.perf_counter() - start,
+                timing,
+                payload_bytes(result) if result is not None else 0,
+                error,
+            )
+
+    async def _resource_name(self, context) -> str:
+        uri = str(context.message.uri)
+        server = context.fastmcp_context.fastmcp if context.fastmcp_context else None
+        if server is None:
+            return uri
+        if self._templates is None:
+            # Components are registered at import time, so this is built once
+            self._static = set(await server.get_resources())
+            self._templates = [
+                (build_regex(key), key) for key in await server.get_resource_templates()
+            ]
+        if uri in self._static:
+            return uri
+        for regex, template in self._templates:
+            if regex.match(uri):
+                return template
+        return uri
+
+
+def _is_error(result: Any) -> bool:
+    """Whether a result reports a failure the way this repo's tools do."""
+    structured = getattr(result, "structured_content", None)
+    if isinstance(structured, dict) and "error" in structured:
+        return True
+    if isinstance(result, list) and result:
+        content = getattr(result[0], "content", None)
+        return isinstance(content, str) and content.startswith("Error:")
+    return False
@@ -0,0 +1,85 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the upstream while the circuit is open."""
+
+
+@dataclass(frozen=True)
+class EndpointTimeout:
+    """Connect, per-read and overall limits in seconds for one endpoint."""
+
+    connect: float = 3.0
+    read: float = 8.0
+    total: float = 10.0
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for idempotent requests."""
+
+    attempts: int = 3
+    base_delay: float = 0.2
+    max_delay: float = 2.0
+
+    def delay(self, attempt: int) -> float:
+        """Seconds to wait before retry number ``attempt`` (starting at 1)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+
+class CircuitBreaker:
+    """Stop calling an upstream after repeated failures, then probe it again.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    every call fails fast for ``reset_timeout`` seconds. The first call after
+    that is let through as a probe: success closes the circuit, failure opens
+    it for another ``reset_timeout``.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self.short_circuited = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` if the call must not reach the upstream."""
+        state = self.state
+        if state == "open":
+            self.short_circuited += 1
+            raise CircuitOpenError("SpaceX API circuit is open; failing fast")
+        if state == "half_open":
+            # Only one probe at a time: the rest keep failing fast until it lands
+            self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                self.times_opened += 1
+            self.opened_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "times_opened": self.times_opened,
+            "short_circuited": self.short_circuited,
+        }
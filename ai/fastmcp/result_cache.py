@@ -0,0 +1,139 @@
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastmcp import Client
+from fastmcp.resources.template import build_regex
+
+from cacheability import cache_policy
+from discovery import CapabilityManifest
+
+# (expires_at, value); expires_at is None for pure results
+Entry = Tuple[Optional[float], Any]
+
+
+def _is_error(value: Any) -> bool:
+    """Spot failures, including the ``{"error": ...}`` results the SpaceX tools return."""
+    if getattr(value, "is_error", False):
+        return True
+    structured = getattr(value, "structured_content", None)
+    if isinstance(structured, dict) and "error" in structured:
+        return True
+    # Resource reads report failures as "Error: ..." text
+    return isinstance(value, list) and any(
+        getattr(content, "text", "").startswith("Error:") for content in value
+    )
+
+
+class ClientResultCache:
+    """Client-side cache for tool calls and resource reads the server marked cacheable.
+
+    Cacheability comes from the ``cache`` entry in each tool's or resource's
+    meta (see ``cacheability.cacheable``), read from the capability manifest.
+    Anything not declared cacheable always goes to the server, and so do
+    streamed calls (a ``stream`` argument or a progress handler), whose data
+    arrives as progress notifications a cached result could not replay. At
+    most ``max_entries`` results are kept, least recently used first out.
+    """
+
+    def __init__(self, client: Client, max_entries: int = 256):
+        self.client = client
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        self._tool_ttls: Dict[str, Optional[float]] = {}
+        self._resource_ttls: Dict[str, Optional[float]] = {}
+        self._template_ttls: List[Tuple["re.Pattern", Optional[float]]] = []
+        self.hits = 0
+        self.misses = 0
+
+    def load_policies(self, manifest: CapabilityManifest) -> None:
+        """Take cacheability declarations from a discovered manifest."""
+        self._tool_ttls.clear()
+        self._resource_ttls.clear()
+        self._template_ttls.clear()
+        for tool in manifest.tools:
+            is_cacheable, ttl = cache_policy(tool.meta)
+            if is_cacheable:
+                self._tool_ttls[tool.name] = ttl
+        for resource in manifest.resources:
+            is_cacheable, ttl = cache_policy(resource.meta)
+            if is_cacheable:
+                self._resource_ttls[str(resource.uri)] = ttl
+        for template in manifest.templates:
+            is_cacheable, ttl = cache_policy(template.meta)
+            if is_cacheable:
+                self._template_ttls.append((build_regex(template.uriTemplate), ttl))
+
+    async def call_tool(
+        self, name: str, arguments: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> Any:
+        streamed = (arguments or {}).get("stream") or kwargs.get("progress_handler")
+        if name not in self._tool_ttls or streamed:
+            return await self.client.call_tool(name, arguments, **kwargs)
+        key = self._tool_key(name, arguments)
+        return await self._get_or_call(
+            key,
+            self._tool_ttls[name],
+            lambda: self.client.call_tool(name, arguments, **kwargs),
+        )
+
+    async def read_resource(self, uri: str) -> Any:
+        cacheable, ttl = self._resource_policy(uri)
+        if not cacheable:
+            return await self.client.read_resource(uri)
+        return await self._get_or_call(
+            f"resource {uri}", ttl, lambda: self.client.read_resource(uri)
+        )
+
+    def invalidate_tool(
+        self, name: str, arguments: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Drop one cached call, or every cached call of ``name`` if no arguments."""
+        if arguments is not None:
+            self._entries.pop(self._tool_key(name, arguments), None)
+            return
+        prefix = f"tool {name} "
+        for key in [key for key in self._entries if key.startswith(prefix)]:
+            del self._entries[key]
+
+    def invalidate_resource(self, uri: str) -> None:
+        self._entries.pop(f"resource {uri}", None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+    def _tool_key(self, name: str, arguments: Optional[Dict[str, Any]]) -> str:
+        return f"tool {name} {json.dumps(arguments or {}, sort_keys=True)}"
+
+    def _resource_policy(self, uri: str) -> Tuple[bool, Optional[float]]:
+        if uri in self._resource_ttls:
+            return True, self._resource_ttls[uri]
+        for regex, ttl in self._template_ttls:
+            if regex.match(uri):
+                return True, ttl
+        return False, None
+
+    async def _get_or_call(self, key: str, ttl: Optional[float], call) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at is None or time.monotonic() < expires_at:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return value
+            del self._entries[key]
+
+        self.misses += 1
+        value = await call()
+        if _is_error(value):
+            return value
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        self._entries[key] = (expires_at, value)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
@@ -0,0 +1,74 @@
+import json
+import os
+from typing import Any, Dict, FrozenSet, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+from metrics import serialization_timer
+
+# Nested blocks that make up most of a launch document's size
+HEAVY_LAUNCH_FIELDS = ("links", "crew", "cores")
+
+
+class ResponseSerializer:
+    """Server-wide JSON settings for tool results and resources.
+
+    Output is compact unless ``pretty`` is set, uses orjson when it is
+    installed, and drops ``omit_fields`` from launch documents unless the
+    caller asks for them back.
+    """
+
+    def __init__(
+        self,
+        pretty: bool = False,
+        omit_fields: Iterable[str] = HEAVY_LAUNCH_FIELDS,
+        use_orjson: bool = True,
+    ):
+        self.pretty = pretty
+        self.omit_fields: FrozenSet[str] = frozenset(omit_fields)
+        self.use_orjson = use_orjson and orjson is not None
+
+    @classmethod
+    def from_env(cls) -> "ResponseSerializer":
+        """Build from SPACEX_JSON_PRETTY and SPACEX_OMIT_FIELDS (comma-separated)."""
+        omit = os.getenv("SPACEX_OMIT_FIELDS", ",".join(HEAVY_LAUNCH_FIELDS))
+        return cls(
+            pretty=os.getenv("SPACEX_JSON_PRETTY", "0") == "1",
+            omit_fields=[field for field in omit.split(",") if field],
+        )
+
+    def dumps(self, data: Any) -> str:
+        with serialization_timer():
+            if self.use_orjson:
+                option = orjson.OPT_INDENT_2 if self.pretty else 0
+                return orjson.dumps(data, option=option).decode()
+            if self.pretty:
+                return json.dumps(data, indent=2)
+            return json.dumps(data, separators=(",", ":"))
+
+    def trim(
+        self, launch: Dict[str, Any], include: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """Return a copy of ``launch`` without the omitted fields not in ``include``.
+
+        Launch documents may be shared with the response cache, so they are
+        never modified in place.
+        """
+        omit = self.omit_fields.difference(include or ())
+        if not omit or not isinstance(launch, dict):
+            return launch
+        return {key: value for key, value in launch.items() if key not in omit}
+
+    def shape(
+        self,
+        launch: Dict[str, Any],
+        include: Optional[Iterable[str]] = None,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Project ``launch`` to ``fields`` if given, else trim it as usual."""
+        if not fields or not isinstance(launch, dict):
+            return self.trim(launch, include)
+        return {field: launch[field] for field in fields if field in launch}
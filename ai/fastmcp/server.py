@@ -1,9 +1,76 @@
 from fastmcp import FastMCP, Context
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
-import aiohttp
-import ssl
-import json
-from typing import Dict, Any
+import asyncio
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Dict, Any, List, Tuple
+
+from cache import CachePolicy, ResponseCache
+from cacheability import READ_ONLY, cacheable
+from http_client import SpaceXHTTPClient
+from launch_mirror import LaunchMirror
+from metrics import MetricsMiddleware, MetricsRegistry
+from resilience import EndpointTimeout
+from serialization import ResponseSerializer
+from static_resources import register_static_resource
+
+# Shared by every tool and resource; opened and closed with the server lifespan.
+# Query pages and the bulk mirror download are larger, so they get more time.
+http_client = SpaceXHTTPClient(
+    timeout=EndpointTimeout(connect=3, read=8, total=10),
+    endpoint_timeouts={
+        "/v5/launches/query": EndpointTimeout(connect=3, read=15, total=20),
+        "/v5/launches": EndpointTimeout(connect=3, read=30, total=60),
+    },
+)
+
+# Launch data changes at most every few minutes, so these endpoints are served
+# from the cache and refreshed in the background once they go stale. Set
+# SPACEX_CACHE_BACKEND=sqlite to share the cache between HTTP worker processes.
+CACHE_POLICIES = {
+    "/v5/launches/latest": CachePolicy(ttl=60, stale_ttl=300),
+    "/v5/launches/upcoming": CachePolicy(ttl=300, stale_ttl=900),
+}
+response_cache = ResponseCache.from_env(max_bytes=16 * 1024 * 1024)
+
+# Compact JSON and no heavy nested launch blocks unless a caller asks for them
+serializer = ResponseSerializer.from_env()
+
+# Largest page the /query endpoint is asked for, and how many such pages a
+# single batch tool call may have in flight at once
+QUERY_PAGE_LIMIT = 100
+MAX_CONCURRENT_QUERIES = 4
+
+# Optional local SQLite mirror that answers searches without the network;
+# enabled by pointing SPACEX_MIRROR_PATH at a database file
+MIRROR_PATH = os.getenv("SPACEX_MIRROR_PATH")
+launch_mirror = (
+    LaunchMirror(
+        MIRROR_PATH,
+        loader=lambda: http_client.fetch_json("GET", "/v5/launches"),
+        sync_interval=float(os.getenv("SPACEX_MIRROR_SYNC_SECONDS", "600")),
+    )
+    if MIRROR_PATH
+    else None
+)
+
+
+# Wall, upstream and serialization time, payload size and errors per tool,
+# resource and prompt; read via metrics://server or, over HTTP, /metrics
+metrics = MetricsRegistry(prefix="spacex_mcp")
+PROMETHEUS_ENDPOINT = os.getenv("SPACEX_PROMETHEUS_METRICS", "0") == "1"
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    """Keep the pooled SpaceX HTTP client and mirror sync running with the server."""
+    async with AsyncExitStack() as stack:
+        await stack.enter_async_context(http_client)
+        if launch_mirror is not None:
+            await stack.enter_async_context(launch_mirror)
+        yield
 
 
 mcp = FastMCP(
@@ -11,107 +78,219 @@ mcp = FastMCP(
     instructions="This server can be used for accessing SpaceX launch data",
     version="1.0.0",
     dependencies=["aiohttp"],
+    lifespan=lifespan,
+    tool_serializer=serializer.dumps,
+    middleware=[MetricsMiddleware(metrics)],
 )
 
 
-def create_ssl_context():
-    """Create an SSL context that bypasses certificate verification."""
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-    return ssl_context
+async def fetch_spacex(method: str, path: str, payload: Any = None) -> Tuple[int, Any]:
+    """Fetch from the SpaceX API, going through the cache for cacheable paths."""
+    policy = CACHE_POLICIES.get(path) if method == "GET" else None
+    if policy is None:
+        return await http_client.fetch_json(method, path, json=payload)
+    return await response_cache.get_or_fetch(
+        f"{method} {path}", lambda: http_client.fetch_json(method, path), policy
+    )
+
+
+def query_options(fields: List[str] = None, **options: Any) -> Dict[str, Any]:
+    """Build /query options, asking the upstream to project to ``fields``."""
+    if fields:
+        options["select"] = " ".join(fields)
+    return options
 
 
-@mcp.tool()
-async def get_latest_spacex_launch(context: Context) -> Dict[str, Any]:
-    """Fetch the latest SpaceX launch data from the SpaceX API."""
+async def fetch_launch(launch_id: str, fields: List[str] = None) -> Tuple[int, Any]:
+    """Fetch one launch, projected upstream via the query API when ``fields`` is set."""
+    if not fields:
+        return await fetch_spacex("GET", f"/v5/launches/{launch_id}")
+    status, data = await fetch_spacex(
+        "POST",
+        "/v5/launches/query",
+        payload={
+            "query": {"_id": launch_id},
+            "options": query_options(fields, limit=1),
+        },
+    )
+    if status != 200:
+        return status, None
+    docs = data.get("docs", [])
+    return (200, docs[0]) if docs else (404, None)
+
+
+@mcp.tool(annotations=READ_ONLY, meta=cacheable(ttl=60))
+async def get_latest_spacex_launch(
+    context: Context,
+    include: List[str] = None,
+    fields: List[str] = None,
+) -> Dict[str, Any]:
+    """Fetch the latest SpaceX launch data from the SpaceX API.
+
+    ``fields`` limits each launch to the named top-level fields. Otherwise
+    heavy nested blocks (links, crew, cores) are left out unless named in
+    ``include``.
+    """
     await context.info("Fetching latest SpaceX launch data...")
 
     try:
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                "https://api.spacexdata.com/v5/launches/latest"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    await context.info("Successfully fetched latest launch data")
-                    return data
-                else:
-                    await context.error(f"Failed to fetch data: HTTP {response.status}")
-                    return {"error": f"HTTP {response.status}"}
+        status, data = await fetch_spacex("GET", "/v5/launches/latest")
+        if status == 200:
+            await context.info("Successfully fetched latest launch data")
+            return serializer.shape(data, include, fields)
+        else:
+            await context.error(f"Failed to fetch data: HTTP {status}")
+            return {"error": f"HTTP {status}"}
     except Exception as e:
         await context.error(f"Error fetching SpaceX data: {str(e)}")
         return {"error": str(e)}
 
 
-@mcp.tool()
-async def get_spacex_launch_by_id(launch_id: str, context: Context) -> Dict[str, Any]:
-    """Fetch a specific SpaceX launch by its ID."""
+@mcp.tool(annotations=READ_ONLY, meta=cacheable(ttl=300))
+async def get_spacex_launch_by_id(
+    launch_id: str,
+    context: Context,
+    include: List[str] = None,
+    fields: List[str] = None,
+) -> Dict[str, Any]:
+    """Fetch a specific SpaceX launch by its ID.
+
+    ``fields`` limits each launch to the named top-level fields. Otherwise
+    heavy nested blocks (links, crew, cores) are left out unless named in
+    ``include``.
+    """
     await context.info(f"Fetching SpaceX launch data for ID: {launch_id}")
 
     try:
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                f"https://api.spacexdata.com/v5/launches/{launch_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    await context.info(
-                        f"Successfully fetched launch data for {launch_id}"
-                    )
-                    return data
-                else:
-                    await context.error(f"Failed to fetch data: HTTP {response.status}")
-                    return {"error": f"HTTP {response.status}"}
+        status, data = await fetch_launch(launch_id, fields)
+        if status == 200:
+            await context.info(f"Successfully fetched launch data for {launch_id}")
+            return serializer.shape(data, include, fields)
+        else:
+            await context.error(f"Failed to fetch data: HTTP {status}")
+            return {"error": f"HTTP {status}"}
     except Exception as e:
         await context.error(f"Error fetching SpaceX data: {str(e)}")
         return {"error": str(e)}
 
 
-@mcp.tool()
-async def get_upcoming_spacex_launches(context: Context) -> Dict[str, Any]:
-    """Fetch upcoming SpaceX launches."""
+@mcp.tool(annotations=READ_ONLY, meta=cacheable(ttl=300))
+async def get_upcoming_spacex_launches(
+    context: Context,
+    include: List[str] = None,
+    fields: List[str] = None,
+) -> Dict[str, Any]:
+    """Fetch upcoming SpaceX launches.
+
+    ``fields`` limits each launch to the named top-level fields. Otherwise
+    heavy nested blocks (links, crew, cores) are left out unless named in
+    ``include``.
+    """
     await context.info("Fetching upcoming SpaceX launches...")
 
     try:
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                "https://api.spacexdata.com/v5/launches/upcoming"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    await context.info(
-                        f"Successfully fetched {len(data)} upcoming launches"
-                    )
-                    return {"launches": data, "count": len(data)}
-                else:
-                    await context.error(f"Failed to fetch data: HTTP {response.status}")
-                    return {"error": f"HTTP {response.status}"}
+        status, data = await fetch_spacex("GET", "/v5/launches/upcoming")
+        if status == 200:
+            await context.info(f"Successfully fetched {len(data)} upcoming launches")
+            launches = [serializer.shape(launch, include, fields) for launch in data]
+            return {"launches": launches, "count": len(launches)}
+        else:
+            await context.error(f"Failed to fetch data: HTTP {status}")
+            return {"error": f"HTTP {status}"}
     except Exception as e:
         await context.error(f"Error fetching SpaceX data: {str(e)}")
         return {"error": str(e)}
 
 
-@mcp.tool()
+async def stream_launch_pages(
+    context: Context,
+    query: Dict[str, Any],
+    page_size: int,
+    include: List[str] = None,
+    fields: List[str] = None,
+) -> Dict[str, Any]:
+    """Walk every page of a launch query, sending each page's docs as progress.
+
+    The next page is requested while the current one is being sent, and docs
+    are not kept once sent, so memory use does not grow with the result set.
+    """
+
+    def fetch_page(page: int) -> "asyncio.Task":
+        return asyncio.create_task(
+            fetch_spacex(
+                "POST",
+                "/v5/launches/query",
+                payload={
+                    "query": query,
+                    "options": query_options(fields, limit=page_size, page=page),
+                },
+            )
+        )
+
+    next_page = fetch_page(1)
+    sent = 0
+    pages = 0
+    try:
+        while next_page is not None:
+            status, data = await next_page
+            if status != 200:
+                await context.error(f"Failed to search: HTTP {status}")
+                return {"error": f"HTTP {status}", "streamed": sent, "pages": pages}
+
+            next_page = None
+            if data.get("hasNextPage"):
+                next_page = fetch_page(data["nextPage"])
+            docs = [
+                serializer.shape(doc, include, fields) for doc in data.get("docs", [])
+            ]
+            sent += len(docs)
+            pages += 1
+            await context.report_progress(
+                progress=sent,
+                total=data.get("totalDocs"),
+                message=serializer.dumps(docs),
+            )
+    finally:
+        # Don't leave a prefetch running if the client went away mid-stream
+        if next_page is not None:
+            next_page.cancel()
+
+    await context.info(f"Streamed {sent} matching launches in {pages} pages")
+    return {"streamed": sent, "pages": pages}
+
+
+@mcp.tool(annotations=READ_ONLY, meta=cacheable(ttl=60))
 async def search_spacex_launches(
     context: Context,
     rocket_name: str = None,
     mission_patch: bool = None,
     success: bool = None,
     limit: int = 10,
+    all_pages: bool = False,
+    stream: bool = False,
+    include: List[str] = None,
+    fields: List[str] = None,
 ) -> Dict[str, Any]:
-    """Search SpaceX launches with optional filters."""
+    """Search SpaceX launches with optional filters.
+
+    When the local mirror is enabled and synced, the search is answered from
+    it and the result carries its ``synced_at`` freshness watermark.
+
+    With ``all_pages`` every matching launch is returned in ``docs``. With
+    ``stream`` as well, they are fetched ``limit`` per page and each page's
+    docs are sent as a progress notification message instead, and the result
+    only counts them; this needs a progress handler on the client. Without a
+    progress token to send them on, docs are returned in the result anyway.
+
+    ``fields`` limits each launch to the named top-level fields. Otherwise
+    heavy nested blocks (links, crew, cores) are left out unless named in
+    ``include``.
+    """
     await context.info(f"Searching SpaceX launches with filters...")
 
     try:
         # Build query parameters
-        query = {"limit": limit}
+        query = {}
 
         if rocket_name:
             query["rocket"] = rocket_name
@@ -120,71 +299,185 @@ async def search_spacex_launches(
         if success is not None:
             query["success"] = success
 
+        if launch_mirror is not None and launch_mirror.synced_at is not None:
+            data = launch_mirror.search(
+                rocket=rocket_name,
+                has_patch=mission_patch,
+                success=success,
+                limit=None if all_pages else limit,
+            )
+            data["docs"] = [
+                serializer.shape(doc, include, fields) for doc in data["docs"]
+            ]
+            await context.info(
+                f"Found {len(data['docs'])} matching launches in the local mirror"
+            )
+            return data
+
+        meta = context.request_context.meta
+        if all_pages and stream and meta is not None and meta.progressToken is not None:
+            return await stream_launch_pages(context, query, limit, include, fields)
+
         # Use the query endpoint for more advanced searching
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.post(
-                "https://api.spacexdata.com/v5/launches/query",
-                json={"query": query, "options": {"limit": limit}},
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    await context.info(
-                        f"Found {len(data.get('docs', []))} matching launches"
-                    )
-                    return data
-                else:
-                    await context.error(f"Failed to search: HTTP {response.status}")
-                    return {"error": f"HTTP {response.status}"}
+        options = query_options(fields, limit=limit)
+        if all_pages:
+            options["pagination"] = False
+        status, data = await fetch_spacex(
+            "POST",
+            "/v5/launches/query",
+            payload={"query": query, "options": options},
+        )
+        if status == 200:
+            docs = [
+                serializer.shape(doc, include, fields) for doc in data.get("docs", [])
+            ]
+            await context.info(f"Found {len(docs)} matching launches")
+            # The parsed body may be shared with coalesced callers; don't mutate it
+            return dict(data, docs=docs)
+        else:
+            await context.error(f"Failed to search: HTTP {status}")
+            return {"error": f"HTTP {status}"}
     except Exception as e:
         await context.error(f"Error searching SpaceX launches: {str(e)}")
         return {"error": str(e)}
 
 
-# SpaceX resource to provide launch data as a resource
-@mcp.resource("spacex://launches/latest")
-async def spacex_latest_launch_resource():
-    """Provide latest SpaceX launch as a resource."""
+@mcp.tool(annotations=READ_ONLY, meta=cacheable(ttl=300))
+async def get_spacex_launches_by_ids(
+    ids: List[str],
+    context: Context,
+    include: List[str] = None,
+    fields: List[str] = None,
+) -> Dict[str, Any]:
+    """Fetch several SpaceX launches by ID, returned in the order requested.
+
+    ``fields`` limits each launch to the named top-level fields. Otherwise
+    heavy nested blocks (links, crew, cores) are left out unless named in
+    ``include``.
+    """
+    await context.info(f"Fetching {len(ids)} SpaceX launches by ID...")
+
+    unique_ids = list(dict.fromkeys(ids))
+    chunks = [
+        unique_ids[i : i + QUERY_PAGE_LIMIT]
+        for i in range(0, len(unique_ids), QUERY_PAGE_LIMIT)
+    ]
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_QUERIES)
+
+    async def query_chunk(chunk: List[str]) -> Tuple[int, Any]:
+        async with semaphore:
+            return await fetch_spacex(
+                "POST",
+                "/v5/launches/query",
+                payload={
+                    "query": {"_id": {"$in": chunk}},
+                    "options": query_options(fields, limit=len(chunk)),
+                },
+            )
+
+    responses = await asyncio.gather(
+        *(query_chunk(chunk) for chunk in chunks), return_exceptions=True
+    )
+
+    found: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            error = str(response)
+        elif response[0] != 200:
+            error = f"HTTP {response[0]}"
+        else:
+            for launch in response[1].get("docs", []):
+                found[launch["id"]] = serializer.shape(launch, include, fields)
+            continue
+        await context.error(f"Error fetching {len(chunk)} launches: {error}")
+        errors.update(dict.fromkeys(chunk, error))
+
+    results = []
+    for launch_id in ids:
+        if launch_id in found:
+            results.append({"id": launch_id, "launch": found[launch_id]})
+        else:
+            results.append(
+                {"id": launch_id, "error": errors.get(launch_id, "Not found")}
+            )
+
+    await context.info(
+        f"Successfully fetched {len(found)} of {len(unique_ids)} launches"
+    )
+    return {"results": results, "count": len(found)}
+
+
+async def read_launch_resource(path: str, fields: List[str] = None) -> str:
     try:
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                "https://api.spacexdata.com/v5/launches/latest"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return json.dumps(data, indent=2)
-                else:
-                    return f"Error: HTTP {response.status}"
+        if path == "latest":
+            status, data = await fetch_spacex("GET", "/v5/launches/latest")
+        else:
+            status, data = await fetch_launch(path, fields)
+        if status == 200:
+            return serializer.dumps(serializer.shape(data, fields=fields))
+        else:
+            return f"Error: HTTP {status}"
     except Exception as e:
         return f"Error: {str(e)}"
 
 
-@mcp.resource("spacex://launches/{launch_id}")
+# SpaceX resource to provide launch data as a resource
+@mcp.resource("spacex://launches/latest", meta=cacheable(ttl=60))
+async def spacex_latest_launch_resource():
+    """Provide latest SpaceX launch as a resource."""
+    return await read_launch_resource("latest")
+
+
+@mcp.resource("spacex://launches/latest/fields/{fields}", meta=cacheable(ttl=60))
+async def spacex_latest_launch_fields_resource(fields: str):
+    """Provide selected fields (comma-separated) of the latest SpaceX launch."""
+    return await read_launch_resource("latest", fields.split(","))
+
+
+@mcp.resource("spacex://launches/{launch_id}", meta=cacheable(ttl=300))
 async def spacex_launch_resource(launch_id: str):
     """Provide specific SpaceX launch data as a resource."""
-    try:
-        ssl_context = create_ssl_context()
-        connector = aiohttp.TCPConnector(ssl=ssl_context)
-        async with aiohttp.ClientSession(connector=connector) as session:
-            async with session.get(
-                f"https://api.spacexdata.com/v5/launches/{launch_id}"
-            ) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    return json.dumps(data, indent=2)
-                else:
-                    return f"Error: HTTP {response.status}"
-    except Exception as e:
-        return f"Error: {str(e)}"
+    return await read_launch_resource(launch_id)
+
+
+@mcp.resource("spacex://launches/{launch_id}/fields/{fields}", meta=cacheable(ttl=300))
+async def spacex_launch_fields_resource(launch_id: str, fields: str):
+    """Provide selected fields (comma-separated) of a specific SpaceX launch."""
+    return await read_launch_resource(launch_id, fields.split(","))
+
+
+@mcp.resource("spacex://cache/stats")
+def spacex_cache_stats():
+    """Provide response cache hit/miss counters as a resource."""
+    return serializer.dumps(response_cache.stats())
 
 
-@mcp.resource("spacex://rockets/list")
-def spacex_rockets_list():
-    """Provide a static list of SpaceX rockets as a resource."""
-    rockets = {
+@mcp.resource("spacex://upstream/stats")
+def spacex_upstream_stats():
+    """Provide upstream request, retry, timeout and circuit breaker counters."""
+    return serializer.dumps(http_client.stats())
+
+
+@mcp.resource("metrics://server", mime_type="application/json")
+def server_metrics():
+    """Provide per-tool, resource and prompt timings, slowest in total first."""
+    return serializer.dumps(metrics.snapshot())
+
+
+if PROMETHEUS_ENDPOINT:
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def prometheus_metrics(request: Request) -> PlainTextResponse:
+        """Serve the same metrics in the Prometheus text format (HTTP transports)."""
+        return PlainTextResponse(
+            metrics.prometheus(), media_type="text/plain; version=0.0.4"
+        )
+
+
+def spacex_rockets() -> Dict[str, Any]:
+    """Constant content, built and serialized on its first read only."""
+    return {
         "rockets": [
             {
                 "id": "falcon1",
@@ -260,7 +553,15 @@ def spacex_rockets_list():
         "retired_count": 1,
         "in_development_count": 1,
     }
-    return json.dumps(rockets, indent=2)
+
+
+rockets_list = register_static_resource(
+    mcp,
+    "spacex://rockets/list",
+    spacex_rockets,
+    name="spacex_rockets_list",
+    description="Provide a static list of SpaceX rockets as a resource.",
+)
 
 
 @mcp.prompt("spacex_launch_summary")
@@ -0,0 +1,91 @@
+import hashlib
+import json
+from functools import cached_property
+from typing import Any, Callable
+
+from fastmcp import FastMCP
+
+from cacheability import cacheable
+
+
+class StaticResource:
+    """Constant JSON content, serialized on first read and then reused.
+
+    ``load`` is not called until a read needs the data, so server start-up
+    neither builds nor serializes it. The ETag hashes the compact form.
+    """
+
+    def __init__(self, load: Callable[[], Any]):
+        self.load = load
+
+    @cached_property
+    def data(self) -> Any:
+        return self.load()
+
+    @cached_property
+    def compact(self) -> str:
+        return json.dumps(self.data, separators=(",", ":"))
+
+    @cached_property
+    def etag(self) -> str:
+        return hashlib.sha256(self.compact.encode()).hexdigest()[:16]
+
+    @cached_property
+    def pretty(self) -> str:
+        return json.dumps(self.data, indent=2)
+
+
+def register_static_resource(
+    mcp: FastMCP, uri: str, load: Callable[[], Any], name: str, description: str
+) -> StaticResource:
+    """Register the constant JSON returned by ``load`` under ``uri`` and three
+    companion URIs.
+
+    - ``uri`` returns the compact form
+    - ``uri/pretty`` returns the indented form
+    - ``uri/etag`` returns ``{"etag": ...}``, a cheap check for a new version
+    - ``uri/if-none-match/{etag}`` returns a small not-modified reply when the
+      client already holds that version, and the compact form otherwise
+    """
+    resource = StaticResource(load)
+    # Constant content, so clients may keep it until the ETag changes
+    meta = cacheable()
+
+    @mcp.resource(
+        uri, name=name, description=description, mime_type="application/json", meta=meta
+    )
+    def read_compact() -> str:
+        return resource.compact
+
+    @mcp.resource(
+        f"{uri}/pretty",
+        name=f"{name}_pretty",
+        description=f"{description} (indented)",
+        mime_type="application/json",
+        meta=meta,
+    )
+    def read_pretty() -> str:
+        return resource.pretty
+
+    @mcp.resource(
+        f"{uri}/etag",
+        name=f"{name}_etag",
+        description=f"{description} (ETag only)",
+        mime_type="application/json",
+    )
+    def read_etag() -> str:
+        return json.dumps({"etag": resource.etag})
+
+    @mcp.resource(
+        f"{uri}/if-none-match/{{etag}}",
+        name=f"{name}_if_none_match",
+        description=f"{description} (conditional on ETag)",
+        mime_type="application/json",
+        meta=meta,
+    )
+    def read_if_none_match(etag: str) -> str:
+        if etag == resource.etag:
+            return json.dumps({"status": "not_modified", "etag": etag})
+        return resource.compact
+
+    return resource
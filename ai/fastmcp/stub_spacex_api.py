@@ -0,0 +1,167 @@
+"""Local stand-in for api.spacexdata.com used by the benchmarks.
+
+Run it on its own with ``python stub_spacex_api.py --port 8765`` and point the
+server at it with ``SPACEX_API_BASE_URL=http://127.0.0.1:8765``.
+"""
+
+import argparse
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+ROCKETS = ["falcon1", "falcon9", "falconheavy", "starship"]
+
+
+def make_launch(index: int, padding: int = 0) -> Dict[str, Any]:
+    """Build a launch document shaped like the real v5 API response."""
+    return {
+        "id": f"{index:024x}",
+        "name": f"Stub Mission {index}",
+        "flight_number": index,
+        "date_utc": f"{2006 + index % 20}-{1 + index % 12:02d}-15T12:00:00.000Z",
+        "rocket": ROCKETS[index % len(ROCKETS)],
+        "success": index % 10 != 0,
+        "upcoming": False,
+        "details": "x" * padding,
+        "links": {
+            "patch": {
+                "small": f"https://images.example/{index}.png" if index % 3 else None,
+                "large": None,
+            },
+            "webcast": f"https://youtu.be/{index}",
+        },
+        "crew": [],
+        "cores": [{"core": f"core{index}", "flight": 1, "landing_success": True}],
+    }
+
+
+def _lookup(doc: Dict[str, Any], dotted: str) -> Any:
+    for part in dotted.split("."):
+        if not isinstance(doc, dict):
+            return None
+        doc = doc.get(part)
+    return doc
+
+
+def _matches(doc: Dict[str, Any], query: Dict[str, Any]) -> bool:
+    """Evaluate the subset of MongoDB query syntax the server sends."""
+    for key, expected in query.items():
+        value = _lookup(doc, "id" if key == "_id" else key)
+        if isinstance(expected, dict):
+            if "$in" in expected and value not in expected["$in"]:
+                return False
+            if "$exists" in expected and (value is not None) != expected["$exists"]:
+                return False
+        elif value != expected:
+            return False
+    return True
+
+
+def _select(doc: Dict[str, Any], select: Optional[Any]) -> Dict[str, Any]:
+    if not select:
+        return doc
+    fields = select.split() if isinstance(select, str) else list(select)
+    # Like mongoose, the id is returned unless explicitly excluded
+    return {field: doc[field] for field in ["id", *fields] if field in doc}
+
+
+def create_app(
+    launch_count: int = 200, latency: float = 0.0, padding: int = 0
+) -> web.Application:
+    """Create the stub app with ``launch_count`` launches.
+
+    ``latency`` seconds are added to every response and ``padding`` bytes of
+    filler are added to every launch, to simulate a slow or heavy upstream.
+    """
+    launches: List[Dict[str, Any]] = [
+        make_launch(i, padding) for i in range(1, launch_count + 1)
+    ]
+    by_id = {launch["id"]: launch for launch in launches}
+    upcoming = [dict(launch, upcoming=True) for launch in launches[-5:]]
+
+    async def delay():
+        if latency:
+            await asyncio.sleep(latency)
+
+    async def all_launches(request: web.Request) -> web.Response:
+        await delay()
+        return web.json_response(launches)
+
+    async def latest(request: web.Request) -> web.Response:
+        await delay()
+        return web.json_response(launches[-1])
+
+    async def upcoming_launches(request: web.Request) -> web.Response:
+        await delay()
+        return web.json_response(upcoming)
+
+    async def launch_by_id(request: web.Request) -> web.Response:
+        await delay()
+        launch = by_id.get(request.match_info["launch_id"])
+        if launch is None:
+            return web.json_response({"error": "Not Found"}, status=404)
+        return web.json_response(launch)
+
+    async def query(request: web.Request) -> web.Response:
+        await delay()
+        body = await request.json()
+        options = body.get("options", {})
+        matched = [doc for doc in launches if _matches(doc, body.get("query", {}))]
+        if options.get("pagination") is False:
+            limit, page = max(1, len(matched)), 1
+        else:
+            limit, page = int(options.get("limit", 10)), int(options.get("page", 1))
+        total_pages = max(1, -(-len(matched) // limit))
+        start = (page - 1) * limit
+        docs = [
+            _select(doc, options.get("select"))
+            for doc in matched[start : start + limit]
+        ]
+        return web.json_response(
+            {
+                "docs": docs,
+                "totalDocs": len(matched),
+                "limit": limit,
+                "page": page,
+                "totalPages": total_pages,
+                "hasNextPage": page < total_pages,
+                "nextPage": page + 1 if page < total_pages else None,
+            }
+        )
+
+    app = web.Application()
+    app.router.add_get("/v5/launches", all_launches)
+    app.router.add_get("/v5/launches/latest", latest)
+    app.router.add_get("/v5/launches/upcoming", upcoming_launches)
+    app.router.add_post("/v5/launches/query", query)
+    app.router.add_get("/v5/launches/{launch_id}", launch_by_id)
+    return app
+
+
+async def start_stub(port: int = 0, **app_options) -> web.AppRunner:
+    """Start the stub in the running loop; read the bound port from the runner."""
+    runner = web.AppRunner(create_app(**app_options), access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", port)
+    await site.start()
+    return runner
+
+
+def stub_base_url(runner: web.AppRunner) -> str:
+    host, port = runner.addresses[0][:2]
+    return f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--launches", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--padding", type=int, default=0)
+    args = parser.parse_args()
+    web.run_app(
+        create_app(args.launches, args.latency, args.padding),
+        host="127.0.0.1",
+        port=args.port,
+    )
@@ -0,0 +1,131 @@
+import base64
+from typing import Any, Dict, List, Union
+
+import numpy as np
+
+# A packed JSON list of numbers, or base64 of a little-endian buffer
+Values = Union[List[int], List[float], str]
+
+DTYPES = ("int32", "int64", "float32", "float64")
+
+# Integer arrays use floor division so results keep the input dtype
+OPS = {
+    "add": (np.add, np.add),
+    "subtract": (np.subtract, np.subtract),
+    "multiply": (np.multiply, np.multiply),
+    "divide": (np.true_divide, np.floor_divide),
+    "minimum": (np.minimum, np.minimum),
+    "maximum": (np.maximum, np.maximum),
+    "power": (np.power, np.power),
+}
+
+
+def little_endian(dtype: str) -> np.dtype:
+    if dtype not in DTYPES:
+        raise ValueError(f"Unsupported dtype {dtype!r}, expected one of {DTYPES}")
+    return np.dtype(dtype).newbyteorder("<")
+
+
+def decode(values: Values, dtype: str) -> np.ndarray:
+    """Read ``values`` as a 1-D array of ``dtype``, refusing lossy casts."""
+    target = little_endian(dtype)
+    if isinstance(values, str):
+        raw = base64.b64decode(values, validate=True)
+        array = np.frombuffer(raw, dtype=target)
+    else:
+        given = np.asarray(values)
+        if given.dtype == object:
+            raise ValueError("Values must be numbers within int64 or float64 range")
+        with np.errstate(all="ignore"):
+            array = given.astype(target)
+        if not np.array_equal(array, given) and np.issubdtype(target, np.integer):
+            raise ValueError(f"Values cannot be represented as {dtype} exactly")
+    if np.issubdtype(target, np.floating) and not np.isfinite(array).all():
+        raise ValueError(f"Values must be finite {dtype} numbers")
+    return array
+
+
+def encode(array: np.ndarray, like: Values, dtype: str) -> Dict[str, Any]:
+    """Return ``array`` as ``dtype`` in the same encoding as ``like``.
+
+    Tools return this as an untyped object: a typed list output would be
+    validated item by item against the output schema on both ends.
+    """
+    array = array.astype(little_endian(dtype), copy=False)
+    if isinstance(like, str):
+        return {"dtype": dtype, "values": base64.b64encode(array.tobytes()).decode()}
+    return {"dtype": dtype, "values": array.tolist()}
+
+
+def elementwise(op: str, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Apply ``op``, raising ValueError instead of wrapping, dividing by zero
+    or producing a non-finite value."""
+    if op not in OPS:
+        raise ValueError(f"Unknown op {op!r}, expected one of {tuple(OPS)}")
+    if len(a) != len(b) and 1 not in (len(a), len(b)):
+        raise ValueError(f"Length mismatch: {len(a)} and {len(b)}")
+    floating, integer = OPS[op]
+    if np.issubdtype(a.dtype, np.integer):
+        return _checked_integer(op, integer, a, b)
+    try:
+        with np.errstate(all="raise", under="ignore"):
+            result = floating(a, b)
+    except FloatingPointError as e:
+        raise ValueError(f"{op} has no finite {a.dtype} result: {e}") from None
+    if not np.isfinite(result).all():
+        raise ValueError(f"{op} has no finite {a.dtype} result")
+    return result
+
+
+def _checked_integer(op: str, fn: Any, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    if op == "divide" and (b == 0).any():
+        raise ValueError("Integer division by zero")
+    # int32 results are computed as int64, then range checked
+    x, y = a.astype(np.int64), b.astype(np.int64)
+    low = np.iinfo(np.int64).min
+    with np.errstate(all="ignore"):
+        result = fn(x, y)
+        if op == "add":
+            wrapped = ((x > 0) & (y > 0) & (result < 0)) | (
+                (x < 0) & (y < 0) & (result >= 0)
+            )
+        elif op == "subtract":
+            wrapped = ((x >= 0) & (y < 0) & (result < 0)) | (
+                (x < 0) & (y > 0) & (result >= 0)
+            )
+        elif op == "multiply":
+            nonzero = y != 0
+            wrapped = (nonzero & (result // np.where(nonzero, y, 1) != x)) | (
+                ((x == -1) & (y == low)) | ((x == low) & (y == -1))
+            )
+        elif op == "divide":
+            wrapped = (x == low) & (y == -1)
+        elif op == "power":
+            # Checked on the float64 result, which errs towards refusing
+            # exact results within rounding distance of the int64 limits
+            approx = np.power(x.astype(np.float64), y)
+            wrapped = (approx >= 2.0**63) | (approx < -(2.0**63))
+        else:
+            wrapped = np.zeros(1, dtype=bool)
+    info = np.iinfo(a.dtype)
+    if wrapped.any() or (
+        result.size and (result.min() < info.min or result.max() > info.max)
+    ):
+        raise ValueError(f"{op} overflows {a.dtype}")
+    return result
+
+
+def total(values: np.ndarray) -> Union[int, float]:
+    """Sum as a JSON number; integer sums are exact, whatever their size."""
+    if np.issubdtype(values.dtype, np.integer):
+        # Sum the high and low 32 bits separately so neither int64 sum can
+        # overflow, then recombine as a Python int
+        values = values.astype(np.int64, copy=False)
+        high = int((values >> 32).sum())
+        low = int((values & 0xFFFFFFFF).sum())
+        return (high << 32) + low
+    with np.errstate(over="ignore"):
+        result = float(values.sum(dtype=np.float64))
+    if not np.isfinite(result):
+        raise ValueError("Sum overflows float64")
+    return result
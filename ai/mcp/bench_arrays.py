@@ -0,0 +1,181 @@
+"""Correctness and throughput of the array tools against the scalar ``add``.
+
+Checks ``add_many``, ``reduce_sum`` and ``elementwise_op`` against ``add``
+and plain Python for both encodings and every dtype, then times summing a
+series over an in-memory MCP session:
+
+- one ``add`` call per element (``--scalar-calls`` of them)
+- one ``add_many``/``reduce_sum`` call as a JSON list
+- one ``add_many``/``reduce_sum`` call as a base64 buffer
+
+    python bench_arrays.py --elements 1000000
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import logging
+import random
+import time
+from typing import Any, Dict
+
+import numpy as np
+from mcp import ClientSession
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+
+
+def packed(values: np.ndarray) -> str:
+    return base64.b64encode(
+        values.astype(values.dtype.newbyteorder("<")).tobytes()
+    ).decode()
+
+
+def unpacked(text: str, dtype: str) -> np.ndarray:
+    return np.frombuffer(
+        base64.b64decode(text), dtype=np.dtype(dtype).newbyteorder("<")
+    )
+
+
+async def call(session: ClientSession, name: str, arguments: Dict[str, Any]) -> Any:
+    result = await session.call_tool(name, arguments)
+    if result.isError:
+        raise AssertionError(f"{name} failed: {result.content[0].text}")
+    value = result.structuredContent["result"]
+    # Array results are {"dtype": ..., "values": ...}
+    return value["values"] if isinstance(value, dict) else value
+
+
+async def check(session: ClientSession) -> None:
+    rng = random.Random(0)
+    a = [rng.randint(-1000, 1000) for _ in range(50)]
+    # Nonzero, so integer division is defined for every pair
+    b = [rng.choice((-1, 1)) * rng.randint(1, 1000) for _ in range(50)]
+    expected = [await call(session, "add", {"a": x, "b": y}) for x, y in zip(a, b)]
+
+    for dtype in ("int32", "int64", "float32", "float64"):
+        got = await call(session, "add_many", {"a": a, "b": b, "dtype": dtype})
+        assert got == expected, dtype
+        got = await call(
+            session,
+            "add_many",
+            {
+                "a": packed(np.array(a, dtype)),
+                "b": packed(np.array(b, dtype)),
+                "dtype": dtype,
+            },
+        )
+        assert unpacked(got, dtype).tolist() == expected, dtype
+        got = await call(session, "reduce_sum", {"values": a, "dtype": dtype})
+        assert got == sum(a), dtype
+
+    ops = {
+        "subtract": lambda x, y: x - y,
+        "multiply": lambda x, y: x * y,
+        "divide": lambda x, y: x // y,
+        "minimum": min,
+        "maximum": max,
+    }
+    for op, fn in ops.items():
+        got = await call(
+            session,
+            "elementwise_op",
+            {"op": op, "a": a, "b": b, "dtype": "int64"},
+        )
+        assert got == [fn(x, y) for x, y in zip(a, b)], op
+    got = await call(
+        session,
+        "elementwise_op",
+        {"op": "power", "a": [1.5, 2.0], "b": [2.0], "dtype": "float64"},
+    )
+    assert got == [2.25, 4.0]
+
+    # Exact even where an int64 accumulator would overflow
+    big = [2**62, 2**62, 2**62, -5]
+    assert await call(session, "reduce_sum", {"values": big, "dtype": "int64"}) == sum(
+        big
+    )
+
+    for name, arguments in (
+        ("add_many", {"a": [1, 2], "b": [1, 2, 3]}),
+        ("add_many", {"a": "not base64!", "b": "AAAA"}),
+        ("reduce_sum", {"values": [1], "dtype": "uint8"}),
+        ("elementwise_op", {"op": "modulo", "a": [1], "b": [1]}),
+        ("elementwise_op", {"op": "divide", "a": [7, 8], "b": [0], "dtype": "int64"}),
+        ("elementwise_op", {"op": "divide", "a": [1.0], "b": [0.0]}),
+        ("elementwise_op", {"op": "power", "a": [10.0], "b": [400.0]}),
+        ("add_many", {"a": [2**31 - 1], "b": [1], "dtype": "int32"}),
+        ("add_many", {"a": [2**63 - 1], "b": [1], "dtype": "int64"}),
+        (
+            "elementwise_op",
+            {"op": "multiply", "a": [2**62], "b": [4], "dtype": "int64"},
+        ),
+        ("elementwise_op", {"op": "power", "a": [3], "b": [40], "dtype": "int64"}),
+        ("add_many", {"a": [1.5], "b": [1], "dtype": "int64"}),
+        ("add_many", {"a": [1e300], "b": [1.0], "dtype": "float32"}),
+        ("reduce_sum", {"values": [1e308, 1e308]}),
+    ):
+        result = await session.call_tool(name, arguments)
+        assert result.isError, (name, arguments)
+    print("correctness: ok")
+
+
+async def throughput(session: ClientSession, elements: int, scalar_calls: int) -> None:
+    values = np.random.default_rng(0).integers(-1000, 1000, elements).astype("int64")
+    as_list = values.tolist()
+    as_base64 = packed(values)
+
+    rows = []
+    start = time.perf_counter()
+    running = 0
+    for x in as_list[:scalar_calls]:
+        running = await call(session, "add", {"a": running, "b": x})
+    scalar = (time.perf_counter() - start) / scalar_calls
+    rows.append(("add, one call per element", scalar * elements))
+
+    for label, tool, arguments, encoded in (
+        ("reduce_sum, JSON list", "reduce_sum", {"values": as_list}, as_list),
+        ("reduce_sum, base64", "reduce_sum", {"values": as_base64}, as_base64),
+        ("add_many, JSON list", "add_many", {"a": as_list, "b": as_list}, as_list),
+        ("add_many, base64", "add_many", {"a": as_base64, "b": as_base64}, as_base64),
+    ):
+        arguments["dtype"] = "int64"
+        start = time.perf_counter()
+        result = await call(session, tool, arguments)
+        elapsed = time.perf_counter() - start
+        if tool == "reduce_sum":
+            assert result == int(values.sum())
+        else:
+            got = unpacked(result, "int64") if isinstance(encoded, str) else result
+            assert np.array_equal(got, values * 2)
+        rows.append((label, elapsed))
+
+    print(f"\n{elements:,} int64 elements (add extrapolated from {scalar_calls} calls)")
+    print(f"{'tool':<30} {'seconds':>10} {'elements/s':>14} {'request MB':>11}")
+    for (label, seconds), arguments in zip(
+        rows, (None, as_list, as_base64, as_list, as_base64)
+    ):
+        # The scalar row sends one small request per element
+        size = f"{len(json.dumps(arguments)) / 1e6:.1f}" if arguments else "-"
+        print(f"{label:<30} {seconds:10.3f} {elements / seconds:14,.0f} {size:>11}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    # The SDK logs every request at INFO, which would dominate the timings
+    logging.disable(logging.INFO)
+    async with create_connected_server_and_client_session(
+        server.mcp._mcp_server
+    ) as session:
+        await check(session)
+        await throughput(session, args.elements, args.scalar_calls)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--elements", type=int, default=1_000_000)
+    parser.add_argument("--scalar-calls", type=int, default=500)
+    asyncio.run(main(parser.parse_args()))
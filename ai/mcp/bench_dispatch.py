@@ -0,0 +1,140 @@
+"""Per-call dispatch overhead of the demo server's trivial tool and resource.
+
+First checks that the demo server answers exactly like a stock FastMCP
+serving the same components, errors included, then compares for ``add``
+and ``greeting://{name}``:
+
+- calling the Python function directly
+- dispatch through the stock FastMCP ``call_tool``/``read_resource``
+- dispatch through the demo server (timing and the resource fast path included)
+- a full request over an in-memory MCP client session
+
+    python bench_dispatch.py --calls 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, List, Tuple
+
+from mcp import ClientSession
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+import server
+
+# Requests sent to both servers, successes first, then failures
+PARITY_REQUESTS: List[Tuple[str, Any]] = [
+    ("call_tool", ("add", {"a": 2, "b": 3})),
+    ("call_tool", ("add", {"a": "2", "b": 3})),
+    ("call_tool", ("elementwise_op", {"op": "divide", "a": [7, 9], "b": [2]})),
+    ("call_tool", ("reduce_sum", {"values": "[1, 2, 3]", "dtype": "int64"})),
+    ("read_resource", "greeting://ada"),
+    ("get_prompt", ("greet_user", {"name": "ada"})),
+    ("call_tool", ("add", {"a": "two", "b": 3})),
+    ("call_tool", ("add", {"a": 1})),
+    ("call_tool", ("missing", {})),
+    ("call_tool", ("elementwise_op", {"op": "divide", "a": [1], "b": [0]})),
+    ("call_tool", ("add_many", {"a": [1], "b": [2], "dtype": "int8"})),
+    ("read_resource", "nothing://here"),
+    ("read_resource", "greeting://ada/lovelace"),
+    ("get_prompt", ("missing", {})),
+]
+
+
+def stock_server() -> FastMCP:
+    """The same components on an unmodified FastMCP."""
+    stock = FastMCP("DemoServer")
+    for tool in (server.add, server.add_many, server.reduce_sum, server.elementwise_op):
+        stock.tool()(tool)
+    stock.resource("greeting://{name}")(server.get_greeting)
+    stock.prompt("greet_user")(server.greet_user)
+    return stock
+
+
+async def answer(session: ClientSession, method: str, argument: Any) -> Any:
+    """The result of one request as plain data, or the protocol error."""
+    try:
+        if isinstance(argument, tuple):
+            result = await getattr(session, method)(*argument)
+        else:
+            result = await getattr(session, method)(argument)
+    except McpError as e:
+        return ("error", e.error.code, e.error.message)
+    return result.model_dump(exclude={"meta"})
+
+
+async def check_parity(stock: FastMCP, demo: FastMCP) -> None:
+    async with create_connected_server_and_client_session(
+        stock._mcp_server
+    ) as expected, create_connected_server_and_client_session(demo._mcp_server) as got:
+        for method, argument in PARITY_REQUESTS:
+            want = await answer(expected, method, argument)
+            have = await answer(got, method, argument)
+            assert have == want, (method, argument, have, want)
+    print(f"parity with stock FastMCP: {len(PARITY_REQUESTS)} requests match")
+
+
+async def per_call_us(call: Callable[[int], Awaitable], calls: int) -> float:
+    await call(0)
+    start = time.perf_counter()
+    for i in range(calls):
+        await call(i)
+    return (time.perf_counter() - start) / calls * 1_000_000
+
+
+async def main(calls: int) -> None:
+    # The SDK logs every request at INFO, which would dominate the timings,
+    # and the failures the parity check expects at ERROR
+    logging.disable(logging.ERROR)
+    stock = stock_server()
+    demo = server.mcp
+    await check_parity(stock, demo)
+
+    async def direct_add(i):
+        return server.add(i, 1)
+
+    async def direct_greeting(i):
+        return server.get_greeting(f"user{i % 100}")
+
+    rows = [
+        ("add: direct call", direct_add),
+        ("add: stock FastMCP", lambda i: stock.call_tool("add", {"a": i, "b": 1})),
+        ("add: demo server", lambda i: demo.call_tool("add", {"a": i, "b": 1})),
+        ("greeting: direct call", direct_greeting),
+        (
+            "greeting: stock FastMCP",
+            lambda i: stock.read_resource(f"greeting://user{i % 100}"),
+        ),
+        (
+            "greeting: demo server",
+            lambda i: demo.read_resource(f"greeting://user{i % 100}"),
+        ),
+    ]
+    print(f"{'dispatch':<32} {'us/call':>10}")
+    for label, call in rows:
+        print(f"{label:<32} {await per_call_us(call, calls):10.2f}")
+
+    for label, app in (("stock FastMCP", stock), ("demo server", demo)):
+        async with create_connected_server_and_client_session(
+            app._mcp_server
+        ) as session:
+            tool_us = await per_call_us(
+                lambda i: session.call_tool("add", {"a": i, "b": 1}), calls // 10
+            )
+            resource_us = await per_call_us(
+                lambda i: session.read_resource(f"greeting://user{i % 100}"),
+                calls // 10,
+            )
+        print(f"{'add: session, ' + label:<32} {tool_us:10.2f}")
+        print(f"{'greeting: session, ' + label:<32} {resource_us:10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--calls", type=int, default=5000)
+    asyncio.run(main(parser.parse_args().calls))
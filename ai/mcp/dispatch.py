@@ -0,0 +1,86 @@
+import inspect
+import re
+from typing import Any, Callable, List, Set, Tuple
+
+import pydantic_core
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.resources import Resource
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from pydantic import validate_call
+
+
+class FastDispatchFastMCP(FastMCP):
+    """FastMCP that reads resource templates without per-read setup.
+
+    The stock server rebuilds each template's regex from its URI template on
+    every read, then wraps the function's result in a new resource object
+    before reading it. Here each template registered through ``resource()``
+    is compiled to a regex once, and a matching read calls the (validated)
+    template function directly.
+
+    Reads of concrete resources, templates whose function takes a
+    ``Context``, and any read that fails go through the stock path, so
+    their results and errors are unchanged.
+    """
+
+    def __init__(self, *args: Any, **kw: Any):
+        super().__init__(*args, **kw)
+        self._static_uris: Set[str] = set()
+        self._matchers: List[Tuple[re.Pattern, Callable[..., Any], str]] = []
+
+    def add_resource(self, resource: Resource) -> None:
+        super().add_resource(resource)
+        self._static_uris.add(str(resource.uri))
+
+    def resource(self, uri: str, *args: Any, mime_type: str = None, **kw: Any):
+        register = super().resource(uri, *args, mime_type=mime_type, **kw)
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            register(fn)
+            uri_params = set(re.findall(r"{(\w+)}", uri))
+            if not uri_params:
+                self._static_uris.add(uri)
+            # Same set of parameters as the URI, so no Context to inject
+            elif uri_params == set(inspect.signature(fn).parameters):
+                self._matchers.append(
+                    (template_regex(uri), validate_call(fn), mime_type or "text/plain")
+                )
+            return fn
+
+        return decorator
+
+    async def read_resource(self, uri: Any) -> Any:
+        uri_str = str(uri)
+        if uri_str not in self._static_uris:
+            for regex, fn, mime_type in self._matchers:
+                match = regex.match(uri_str)
+                if match is None:
+                    continue
+                try:
+                    content = await _read(fn(**match.groupdict()))
+                except Exception:
+                    break
+                return [ReadResourceContents(content=content, mime_type=mime_type)]
+        return await super().read_resource(uri)
+
+
+def template_regex(template: str) -> re.Pattern:
+    """Compile ``scheme://{a}/{b}`` so each parameter matches one path segment."""
+    pattern = ""
+    for part in re.split(r"(\{[^}]+\})", template):
+        if part.startswith("{") and part.endswith("}"):
+            pattern += f"(?P<{part[1:-1]}>[^/]+)"
+        else:
+            pattern += re.escape(part)
+    return re.compile(f"^{pattern}$")
+
+
+async def _read(result: Any) -> Any:
+    """Convert a template function's return value to resource content."""
+    if inspect.iscoroutine(result):
+        result = await result
+    if isinstance(result, Resource):
+        return await result.read()
+    if isinstance(result, (str, bytes)):
+        return result
+    return pydantic_core.to_json(result, fallback=str, indent=2).decode()
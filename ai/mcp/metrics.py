@@ -0,0 +1,190 @@
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from mcp.server.fastmcp import FastMCP
+
+from dispatch import template_regex
+
+# Upper bounds in seconds of the wall time histogram buckets, the same as in
+# ai/fastmcp/metrics.py so both servers' histograms can be aggregated
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class OperationMetrics:
+    """Running totals for one tool, resource or prompt."""
+
+    calls: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    payload_bytes: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=1024))
+
+    def record(self, wall: float, payload_bytes: int, error: bool) -> None:
+        self.calls += 1
+        self.errors += error
+        self.wall_seconds += wall
+        self.payload_bytes += payload_bytes
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if wall <= bound:
+                self.buckets[i] += 1
+                break
+        self.recent.append(wall)
+
+    def to_json(self) -> Dict[str, Any]:
+        values = sorted(self.recent)
+
+        def percentile(pct: float) -> float:
+            if not values:
+                return 0.0
+            rank = max(1, round(pct / 100 * len(values)))
+            return values[min(rank, len(values)) - 1] * 1000
+
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "wall_ms_total": self.wall_seconds * 1000,
+            "wall_ms_p50": percentile(50),
+            "wall_ms_p95": percentile(95),
+            "wall_ms_p99": percentile(99),
+            "payload_bytes_total": self.payload_bytes,
+        }
+
+
+class MetricsRegistry:
+    """Per-operation call metrics, keyed by kind and name."""
+
+    def __init__(self, prefix: str = "mcp"):
+        self.prefix = prefix
+        self._operations: Dict[Tuple[str, str], OperationMetrics] = {}
+
+    def record(
+        self, kind: str, name: str, wall: float, payload_bytes: int, error: bool
+    ) -> None:
+        operation = self._operations.get((kind, name))
+        if operation is None:
+            operation = self._operations[(kind, name)] = OperationMetrics()
+        operation.record(wall, payload_bytes, error)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All operations, slowest total wall time first."""
+        ranked = sorted(
+            self._operations.items(), key=lambda item: -item[1].wall_seconds
+        )
+        return {
+            "operations": [
+                {"kind": kind, "name": name, **operation.to_json()}
+                for (kind, name), operation in ranked
+            ]
+        }
+
+    def prometheus(self) -> str:
+        """Render every operation in the Prometheus text exposition format."""
+        p = self.prefix
+        lines = [
+            f"# TYPE {p}_calls_total counter",
+            f"# TYPE {p}_errors_total counter",
+            f"# TYPE {p}_payload_bytes_total counter",
+            f"# TYPE {p}_duration_seconds histogram",
+        ]
+        for (kind, name), operation in self._operations.items():
+            escaped = name.replace("\\", "\\\\").replace('"', '\\"')
+            labels = f'kind="{kind}",name="{escaped}"'
+            lines.append(f"{p}_calls_total{{{labels}}} {operation.calls}")
+            lines.append(f"{p}_errors_total{{{labels}}} {operation.errors}")
+            lines.append(
+                f"{p}_payload_bytes_total{{{labels}}} {operation.payload_bytes}"
+            )
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, operation.buckets):
+                cumulative += count
+                lines.append(
+                    f'{p}_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'{p}_duration_seconds_bucket{{{labels},le="+Inf"}} {operation.calls}'
+            )
+            lines.append(
+                f"{p}_duration_seconds_sum{{{labels}}} {operation.wall_seconds}"
+            )
+            lines.append(f"{p}_duration_seconds_count{{{labels}}} {operation.calls}")
+        return "\n".join(lines) + "\n"
+
+
+def payload_bytes(value: Any) -> int:
+    """Size of the text and binary content in a tool, resource or prompt result."""
+    if isinstance(value, str):
+        return len(value) if value.isascii() else len(value.encode())
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, (list, tuple)):
+        return sum(payload_bytes(item) for item in value)
+    if isinstance(value, dict):
+        # Structured output, which repeats the text content already counted
+        return 0
+    for attr in ("text", "blob", "content", "messages"):
+        inner = getattr(value, attr, None)
+        if inner is not None:
+            return payload_bytes(inner)
+    return 0
+
+
+class InstrumentedFastMCP(FastMCP):
+    """FastMCP that times every tool call, resource read and prompt render.
+
+    The low-level server dispatches to these three methods, so overriding
+    them covers every ``@mcp.tool``, ``@mcp.resource`` and ``@mcp.prompt``.
+    Reads through a resource template are recorded under the template.
+    """
+
+    def __init__(self, *args: Any, metrics: Optional[MetricsRegistry] = None, **kw):
+        super().__init__(*args, **kw)
+        self.metrics = metrics or MetricsRegistry()
+        self._templates: Optional[List[Tuple[re.Pattern, str]]] = None
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        return await self._timed("tool", name, super().call_tool(name, arguments))
+
+    async def read_resource(self, uri: Any) -> Any:
+        name = await self._resource_name(str(uri))
+        return await self._timed("resource", name, super().read_resource(uri))
+
+    async def get_prompt(self, name: str, arguments: Dict[str, Any] = None) -> Any:
+        return await self._timed("prompt", name, super().get_prompt(name, arguments))
+
+    async def _timed(self, kind: str, name: str, call: Any) -> Any:
+        start = time.perf_counter()
+        error = True
+        result = None
+        try:
+            result = await call
+            error = _is_error(result)
+            return result
+        finally:
+            self.metrics.record(
+                kind,
+                name,
+                time.perf_counter() - start,
+                payload_bytes(result) if result is not None else 0,
+                error,
+            )
+
+    async def _resource_name(self, uri: str) -> str:
+        if self._templates is None:
+            self._templates = [
+                (template_regex(template.uriTemplate), template.uriTemplate)
+                for template in await self.list_resource_templates()
+            ]
+        for regex, template in self._templates:
+            if regex.match(uri):
+                return template
+        return uri
+
+
+def _is_error(result: Any) -> bool:
+    """Whether a result reports a failure instead of raising it."""
+    return bool(getattr(result, "isError", False))
@@ -1,8 +1,23 @@
 # server.py
-from mcp.server.fastmcp import FastMCP
+import json
+import os
+from typing import Any, Dict, Union
 
-# Create an MCP server
-mcp = FastMCP("DemoServer")
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from arrays import Values, decode, elementwise, encode, total
+from dispatch import FastDispatchFastMCP
+from metrics import InstrumentedFastMCP, MetricsRegistry
+
+
+class DemoMCP(InstrumentedFastMCP, FastDispatchFastMCP):
+    """Times every call, then dispatches it through the fast path."""
+
+
+# Create an MCP server that times every tool, resource and prompt
+metrics = MetricsRegistry(prefix="demo_mcp")
+mcp = DemoMCP("DemoServer", metrics=metrics)
 
 
 # Add an addition tool
@@ -12,6 +27,32 @@ def add(a: int, b: int) -> int:
     return a + b
 
 
+# Array variants: one call covers a whole series instead of one pair. Values
+# are a JSON list of numbers or base64 of a little-endian buffer of ``dtype``
+# (int32, int64, float32 or float64). Array results come back as
+# {"dtype": ..., "values": ...} with values in the same encoding as ``a``.
+# Overflow, division by zero, non-finite results and lossy casts are errors.
+@mcp.tool()
+def add_many(a: Values, b: Values, dtype: str = "float64") -> Dict[str, Any]:
+    """Add two arrays element by element"""
+    return encode(elementwise("add", decode(a, dtype), decode(b, dtype)), a, dtype)
+
+
+@mcp.tool()
+def reduce_sum(values: Values, dtype: str = "float64") -> Union[int, float]:
+    """Sum an array; integer sums are exact"""
+    return total(decode(values, dtype))
+
+
+@mcp.tool()
+def elementwise_op(
+    op: str, a: Values, b: Values, dtype: str = "float64"
+) -> Dict[str, Any]:
+    """Apply add, subtract, multiply, divide, minimum, maximum or power element by
+    element; a length-1 array is broadcast. Integer division rounds down."""
+    return encode(elementwise(op, decode(a, dtype), decode(b, dtype)), a, dtype)
+
+
 # Add a dynamic greeting resource
 @mcp.resource("greeting://{name}")
 def get_greeting(name: str) -> str:
@@ -23,3 +64,19 @@ def get_greeting(name: str) -> str:
 def greet_user(name: str) -> str:
     """Generate a greeting message for the user"""
     return f"Welcome to the MCP server, {name}!"
+
+
+@mcp.resource("metrics://server", mime_type="application/json")
+def server_metrics() -> str:
+    """Per-tool, resource and prompt call counts, latency and payload size"""
+    return json.dumps(metrics.snapshot())
+
+
+# Prometheus text endpoint, served when running over SSE or streamable HTTP
+if os.getenv("MCP_PROMETHEUS_METRICS", "0") == "1":
+
+    @mcp.custom_route("/metrics", methods=["GET"])
+    async def prometheus_metrics(request: Request) -> PlainTextResponse:
+        return PlainTextResponse(
+            metrics.prometheus(), media_type="text/plain; version=0.0.4"
+        )
@@ -1,17 +1,24 @@
 from fastapi import FastAPI, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import String, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapped, mapped_column
 
-app = FastAPI()
+from database import Base, get_db, lifespan
+from http_cache import CachePolicy, HTTPCacheMiddleware
 
+app = FastAPI(lifespan=lifespan)
+# Serve repeat reads of the item list from the cache for 30 seconds
+app.add_middleware(HTTPCacheMiddleware, policies={"/items/": CachePolicy(max_age=30)})
 
-def get_db():
-    db = Session()  # Assuming this is a valid session
-    try:
-        yield db
-    finally:
-        db.close()
+
+class Item(Base):
+    __tablename__ = "items"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(100))
 
 
 @app.get("/items/")
-def read_items(db: Session = Depends(get_db)):
-    return {"message": "Using the database session"}
+async def read_items(db: AsyncSession = Depends(get_db)):
+    items = await db.scalars(select(Item).order_by(Item.id).limit(100))
+    return [{"id": item.id, "name": item.name} for item in items]
@@ -1,7 +1,33 @@
 import asyncio
+import os
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+from loop_monitor import BlockingDetector, BlockingDetectorMiddleware
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Threads available to sync (def) endpoints; anyio's default is 40
+    limit = os.getenv("SYNC_THREAD_LIMIT")
+    if limit:
+        anyio.to_thread.current_default_thread_limiter().total_tokens = int(limit)
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+# Logs any route that stalls the event loop; LOOP_BLOCK_OFFLOAD=1 also moves
+# flagged async routes onto a thread pool
+detector = BlockingDetector(
+    threshold=float(os.getenv("LOOP_BLOCK_THRESHOLD", "0.1")),
+    offload=os.getenv("LOOP_BLOCK_OFFLOAD", "0") == "1",
+    max_workers=int(os.getenv("LOOP_BLOCK_WORKERS", "4")),
+)
+app.add_middleware(BlockingDetectorMiddleware, detector=detector)
 
 
 @app.get("/sync")
@@ -16,3 +42,18 @@ def sync_endpoint():
 async def async_endpoint():
     await asyncio.sleep(2)  # Non-blocking operation
     return {"message": "This response was delayed by 2 seconds (async)"}
+
+
+@app.get("/async-blocking")
+async def async_blocking_endpoint():
+    import time
+
+    time.sleep(2)  # Mistake: blocks the event loop for every client
+    return {"message": "This response blocked the event loop for 2 seconds"}
+
+
+@app.get("/metrics")
+def metrics():
+    return PlainTextResponse(
+        detector.prometheus(), media_type="text/plain; version=0.0.4"
+    )
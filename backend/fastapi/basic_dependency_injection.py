@@ -1,12 +1,20 @@
-from fastapi import FastAPI, Depends
+from fastapi import FastAPI
 
-app = FastAPI()
+from dependency_scopes import DependencyScopes
+from http_cache import CachePolicy, HTTPCacheMiddleware
+
+scopes = DependencyScopes()
+app = FastAPI(lifespan=scopes.lifespan)
+app.add_middleware(
+    HTTPCacheMiddleware, policies={"/dependency": CachePolicy(max_age=300)}
+)
 
 
 def common_dependency():
     return "Common Dependency Result"
 
 
+# Built once at start-up instead of on every request
 @app.get("/dependency")
-def use_dependency(data: str = Depends(common_dependency)):
+def use_dependency(data: str = scopes.depends(common_dependency, scope="app")):
     return {"data": data}
@@ -0,0 +1,212 @@
+"""Concurrency benchmark for ``/sync`` and ``/async`` in async_example.py.
+
+Boots the app under uvicorn and drives each endpoint with ``--levels``
+concurrent clients, each sending ``--requests-per-client`` requests in turn.
+Records throughput, p50/p99 latency and the server's peak thread count, and
+writes the results as JSON and markdown.
+
+Both endpoints wait 2 s. ``/async`` does it on the event loop, while
+``/sync`` holds one of anyio's worker threads (40 by default), so past that
+many clients ``/sync`` requests queue. ``--thread-limits`` reruns ``/sync``
+with other limiter sizes (SYNC_THREAD_LIMIT) to tune that ceiling:
+
+    python bench_async.py
+    python bench_async.py --levels 10,100 --thread-limits 100,200,400
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def thread_count(pid: int) -> Optional[int]:
+    """Threads in process ``pid``, where /proc is available."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("Threads:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+async def wait_until_up(base_url: str, server: subprocess.Popen) -> None:
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        for _ in range(100):
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited during start-up")
+            try:
+                await client.get("/metrics")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not start")
+
+
+async def load(
+    base_url: str, path: str, clients: int, requests_per_client: int, pid: int
+) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    peak_threads = thread_count(pid)
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    timeout = httpx.Timeout(None, connect=30.0)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=timeout
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal errors
+            for _ in range(requests_per_client):
+                start = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - start)
+
+        async def sample_threads() -> None:
+            nonlocal peak_threads
+            while True:
+                await asyncio.sleep(0.1)
+                threads = thread_count(pid)
+                if threads is not None:
+                    peak_threads = max(peak_threads or 0, threads)
+
+        sampler = asyncio.create_task(sample_threads())
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        sampler.cancel()
+
+    latencies.sort()
+    return {
+        "path": path,
+        "clients": clients,
+        "requests": len(latencies),
+        "errors": errors,
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else None,
+        "p99_ms": (
+            latencies[max(0, int(len(latencies) * 0.99) - 1)] * 1000
+            if latencies
+            else None
+        ),
+        "peak_threads": peak_threads,
+    }
+
+
+async def scenario(
+    args: argparse.Namespace, path: str, thread_limit: Optional[int]
+) -> List[Dict[str, Any]]:
+    env = dict(os.environ)
+    # Connection bursts at high client counts stall the loop briefly, which
+    # the app's blocking detector would otherwise log on every run
+    env.setdefault("LOOP_BLOCK_THRESHOLD", "1.0")
+    if thread_limit is not None:
+        env["SYNC_THREAD_LIMIT"] = str(thread_limit)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "async_example:app",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+            "--backlog",
+            "4096",
+        ],
+        cwd=HERE,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{args.port}"
+    results = []
+    try:
+        await wait_until_up(base_url, server)
+        for clients in args.levels:
+            result = await load(
+                base_url, path, clients, args.requests_per_client, server.pid
+            )
+            result["thread_limit"] = thread_limit
+            results.append(result)
+            print(row(result), flush=True)
+    finally:
+        server.terminate()
+        server.wait()
+    return results
+
+
+def row(result: Dict[str, Any]) -> str:
+    def ms(value: Optional[float]) -> str:
+        return f"{value:.0f}" if value is not None else "-"
+
+    limit = result["thread_limit"] or "default"
+    return (
+        f"| {result['path']} | {limit} | {result['clients']} | {result['requests']} "
+        f"| {result['errors']} | {result['rps']:.1f} | {ms(result['p50_ms'])} "
+        f"| {ms(result['p99_ms'])} | {result['peak_threads'] or '-'} |"
+    )
+
+
+HEADER = (
+    "| path | thread limit | clients | requests | errors | req/s | p50 ms "
+    "| p99 ms | peak threads |\n"
+    "|---|---|---|---|---|---|---|---|---|"
+)
+
+
+async def main(args: argparse.Namespace) -> None:
+    print(HEADER)
+    results = []
+    for path, thread_limit in [("/async", None), ("/sync", None)] + [
+        ("/sync", limit) for limit in args.thread_limits
+    ]:
+        results += await scenario(args, path, thread_limit)
+
+    with open(f"{args.output}.json", "w") as f:
+        json.dump(results, f, indent=2)
+    with open(f"{args.output}.md", "w") as f:
+        f.write(
+            f"# /sync vs /async\n\n{args.requests_per_client} requests per client, "
+            f"Python {sys.version.split()[0]}, {os.cpu_count()} CPUs\n\n"
+        )
+        f.write(HEADER + "\n" + "\n".join(row(r) for r in results) + "\n")
+    print(f"Wrote {args.output}.json and {args.output}.md")
+
+
+def int_list(value: str) -> List[int]:
+    return [int(v) for v in value.split(",") if v]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--levels", type=int_list, default=[10, 100, 1000])
+    parser.add_argument("--requests-per-client", type=int, default=2)
+    parser.add_argument(
+        "--thread-limits",
+        type=int_list,
+        default=[],
+        help="extra /sync runs with these anyio thread limiter sizes",
+    )
+    parser.add_argument("--port", type=int, default=8023)
+    parser.add_argument("--output", default="bench_async_report")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,86 @@
+"""Per-request cost of resolving a dependency in each scope.
+
+Serves one route per scope over an in-process ASGI transport, so the timings
+are FastAPI's request handling plus dependency resolution, with no network:
+
+- ``none``: no dependency, the floor
+- ``request``: FastAPI's ``Depends``, run on every request
+- ``app``: built once at start-up
+- ``ttl``: built at start-up and refreshed in the background
+
+Each is measured with a trivial sync dependency, which FastAPI still runs
+in a worker thread per request, and with one that takes ``--cost-ms`` to
+build, standing in for loading config or creating a client.
+
+    python bench_dependency_scopes.py --requests 2000
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from dependency_scopes import DependencyScopes
+
+
+def make_app(cost: float) -> FastAPI:
+    scopes = DependencyScopes()
+    app = FastAPI(lifespan=scopes.lifespan)
+
+    def trivial():
+        return "value"
+
+    def expensive():
+        time.sleep(cost)
+        return {"setting": "value"}
+
+    @app.get("/none")
+    async def no_dependency():
+        return {"data": None}
+
+    for kind, dependency in (("trivial", trivial), ("expensive", expensive)):
+        for scope in ("request", "app", "ttl"):
+
+            async def endpoint(data=scopes.depends(dependency, scope=scope)):
+                return {"data": data}
+
+            app.get(f"/{kind}/{scope}")(endpoint)
+    return app
+
+
+async def per_request_us(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    await client.get(path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path)
+        response.raise_for_status()
+    return (time.perf_counter() - start) / requests * 1_000_000
+
+
+async def main(args: argparse.Namespace) -> None:
+    app = make_app(args.cost_ms / 1000)
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench"
+        ) as client:
+            print(f"{'route':<22} {'us/request':>12}")
+            paths = ["/none"] + [
+                f"/{kind}/{scope}"
+                for kind in ("trivial", "expensive")
+                for scope in ("request", "app", "ttl")
+            ]
+            for path in paths:
+                us = await per_request_us(client, path, args.requests)
+                print(f"{path:<22} {us:12.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--cost-ms", type=float, default=2.0)
+    asyncio.run(main(parser.parse_args()))
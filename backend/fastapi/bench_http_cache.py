@@ -0,0 +1,103 @@
+"""Latency saved by the HTTP cache on ``/items/``.
+
+Seeds a SQLite database, starts advanced_dependency_injection.py under
+uvicorn and sends ``--requests`` sequential requests in each mode:
+
+- ``handler``: ``Cache-Control: no-cache``, so the query and serialization
+  run every time, as before the cache
+- ``cached``: a fresh cached response, sent in full
+- ``304``: a conditional request whose ``If-None-Match`` matches
+
+    python bench_http_cache.py --requests 1000 --rows 100
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+
+from bench_items import HERE, seed, wait_until_up
+
+
+async def measure(
+    client: httpx.AsyncClient, headers: Dict[str, str], requests: int, status: int
+) -> Dict[str, float]:
+    latencies: List[float] = []
+    size = 0
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get("/items/", headers=headers)
+        latencies.append(time.perf_counter() - start)
+        assert response.status_code == status, response.status_code
+        size = len(response.content)
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+        "bytes": size,
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    path = os.path.join(tempfile.mkdtemp(), "bench_http_cache.db")
+    url = f"sqlite+aiosqlite:///{path}"
+    await seed(url, args.rows)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "advanced_dependency_injection:app",
+            "--port",
+            str(args.port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=HERE,
+        env=dict(os.environ, DATABASE_URL=url),
+    )
+    try:
+        async with httpx.AsyncClient(
+            base_url=f"http://127.0.0.1:{args.port}"
+        ) as client:
+            await wait_until_up(client, server)
+            etag = (await client.get("/items/")).headers["etag"]
+            results = {
+                "handler": await measure(
+                    client, {"Cache-Control": "no-cache"}, args.requests, 200
+                ),
+                "cached": await measure(client, {}, args.requests, 200),
+                "304": await measure(
+                    client, {"If-None-Match": etag}, args.requests, 304
+                ),
+            }
+    finally:
+        server.terminate()
+        server.wait()
+
+    print(f"/items/ with {args.rows} rows, {args.requests} sequential requests")
+    print(f"{'mode':<10} {'p50 ms':>8} {'p99 ms':>8} {'body bytes':>11} {'saved':>7}")
+    baseline = results["handler"]["p50_ms"]
+    for mode, result in results.items():
+        saved = 1 - result["p50_ms"] / baseline
+        print(
+            f"{mode:<10} {result['p50_ms']:8.2f} {result['p99_ms']:8.2f} "
+            f"{result['bytes']:11} {saved:7.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8025)
+    asyncio.run(main(parser.parse_args()))
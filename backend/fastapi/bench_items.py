@@ -0,0 +1,143 @@
+"""Load test ``/items/`` with and without the connection pool.
+
+Seeds a database with ``--rows`` items, then for each pool mode starts the
+app under uvicorn and sends ``--requests`` requests from ``--concurrency``
+clients:
+
+- ``null``: a new connection per request, as before the pooled engine
+- ``queue``: the app's pooled engine
+
+Defaults to a SQLite file; point ``--database-url`` at Postgres to measure
+the connection cost a real server adds.
+
+    python bench_items.py --requests 5000 --concurrency 50
+    python bench_items.py --database-url postgresql+asyncpg://localhost/bench
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+import httpx
+from sqlalchemy import delete
+
+from advanced_dependency_injection import Item
+from database import Base, create_engine
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Skip the app's HTTP response cache so every request runs the query
+NO_CACHE = {"Cache-Control": "no-cache"}
+
+
+async def seed(url: str, rows: int) -> None:
+    engine = create_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(delete(Item))
+        await conn.execute(
+            Item.__table__.insert(), [{"name": f"item {i}"} for i in range(rows)]
+        )
+    await engine.dispose()
+
+
+async def wait_until_up(client: httpx.AsyncClient, server: subprocess.Popen) -> None:
+    for _ in range(100):
+        if server.poll() is not None:
+            raise RuntimeError("uvicorn exited during start-up")
+        try:
+            await client.get("/items/")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("uvicorn did not start")
+
+
+async def load(base_url: str, requests: int, concurrency: int) -> Dict[str, float]:
+    latencies: List[float] = []
+    remaining = iter(range(requests))
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, headers=NO_CACHE
+    ) as client:
+
+        async def worker() -> None:
+            for _ in remaining:
+                start = time.perf_counter()
+                response = await client.get("/items/")
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000,
+    }
+
+
+async def run(args: argparse.Namespace, pool: str, port: int) -> Dict[str, float]:
+    env = dict(os.environ, DATABASE_URL=args.database_url, DATABASE_POOL=pool)
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "advanced_dependency_injection:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=HERE,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        async with httpx.AsyncClient(base_url=base_url, headers=NO_CACHE) as client:
+            await wait_until_up(client, server)
+        # Warm up before measuring
+        await load(base_url, args.concurrency * 4, args.concurrency)
+        return await load(base_url, args.requests, args.concurrency)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def main(args: argparse.Namespace) -> None:
+    await seed(args.database_url, args.rows)
+    print(f"{args.requests} requests, {args.concurrency} concurrent, {args.rows} rows")
+    print(f"{'pool':<8} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for pool in ("null", "queue"):
+        result = await run(args, pool, args.port)
+        print(
+            f"{pool:<8} {result['rps']:10.1f} {result['p50_ms']:10.2f} "
+            f"{result['p99_ms']:10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--database-url")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--port", type=int, default=8011)
+    args = parser.parse_args()
+    if args.database_url is None:
+        path = os.path.join(tempfile.mkdtemp(), "bench_items.db")
+        args.database_url = f"sqlite+aiosqlite:///{path}"
+    asyncio.run(main(args))
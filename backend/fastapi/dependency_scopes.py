@@ -0,0 +1,121 @@
+import asyncio
+import inspect
+import logging
+from contextlib import AsyncExitStack, asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+SCOPES = ("request", "app", "ttl")
+
+
+class DependencyScopes:
+    """Dependencies that outlive a request.
+
+    FastAPI caches a dependency only within one request. ``depends`` adds two
+    longer scopes for zero-argument dependencies such as config, clients and
+    pools:
+
+    - ``app``: built once in ``lifespan`` and shared until shutdown; a
+      generator dependency is closed at shutdown
+    - ``ttl``: built in ``lifespan`` and rebuilt in the background every
+      ``ttl`` seconds; requests keep getting the previous value while a
+      rebuild runs or if it fails
+    - ``request``: FastAPI's own per-request scope
+
+    Requests read an app or ttl value without calling the dependency at all.
+    """
+
+    def __init__(self):
+        self._scoped: Dict[Callable, Tuple[str, float]] = {}
+        self._providers: Dict[Callable, Callable] = {}
+        self._values: Dict[Callable, Any] = {}
+
+    def depends(
+        self,
+        dependency: Callable[..., Any],
+        *,
+        scope: str = "request",
+        ttl: float = 60.0,
+        use_cache: bool = True,
+    ) -> Any:
+        """Use in place of ``Depends(dependency)`` to pick its scope."""
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown scope {scope!r}, expected one of {SCOPES}")
+        if scope == "request":
+            return Depends(dependency, use_cache=use_cache)
+
+        required = [
+            name
+            for name, param in inspect.signature(dependency).parameters.items()
+            if param.default is inspect.Parameter.empty
+        ]
+        if required:
+            raise TypeError(
+                f"{dependency.__name__} takes {required}; only dependencies "
+                "without arguments can be app or ttl scoped"
+            )
+        if scope == "ttl" and (
+            inspect.isgeneratorfunction(dependency)
+            or inspect.isasyncgenfunction(dependency)
+        ):
+            raise TypeError(f"{dependency.__name__} is a generator; use scope='app'")
+        self._scoped[dependency] = (scope, ttl)
+        if dependency not in self._providers:
+            self._providers[dependency] = self._provider(dependency)
+        return Depends(self._providers[dependency])
+
+    def _provider(self, dependency: Callable) -> Callable:
+        # Async, so FastAPI runs it on the loop rather than in a worker thread
+        async def provide() -> Any:
+            try:
+                return self._values[dependency]
+            except KeyError:
+                raise RuntimeError(
+                    f"{dependency.__name__} has not been built; "
+                    "is DependencyScopes.lifespan the app's lifespan?"
+                ) from None
+
+        provide.__name__ = f"scoped_{dependency.__name__}"
+        return provide
+
+    @asynccontextmanager
+    async def lifespan(self, app: Any) -> AsyncIterator[None]:
+        """Build every app and ttl dependency and keep ttl ones fresh."""
+        async with AsyncExitStack() as stack:
+            refreshers: List[asyncio.Task] = []
+            for dependency, (scope, ttl) in self._scoped.items():
+                self._values[dependency] = await build(dependency, stack)
+                if scope == "ttl":
+                    refreshers.append(
+                        asyncio.create_task(self._refresh(dependency, ttl))
+                    )
+            try:
+                yield
+            finally:
+                for task in refreshers:
+                    task.cancel()
+                await asyncio.gather(*refreshers, return_exceptions=True)
+                self._values.clear()
+
+    async def _refresh(self, dependency: Callable, ttl: float) -> None:
+        while True:
+            await asyncio.sleep(ttl)
+            try:
+                self._values[dependency] = await build(dependency)
+            except Exception:
+                logger.exception(f"Refreshing {dependency.__name__} failed")
+
+
+async def build(dependency: Callable, stack: Optional[AsyncExitStack] = None) -> Any:
+    """Call ``dependency``, entering generators on ``stack``."""
+    if inspect.isasyncgenfunction(dependency):
+        return await stack.enter_async_context(asynccontextmanager(dependency)())
+    if inspect.isgeneratorfunction(dependency):
+        return stack.enter_context(contextmanager(dependency)())
+    if inspect.iscoroutinefunction(dependency):
+        return await dependency()
+    return await run_in_threadpool(dependency)
@@ -0,0 +1,255 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long a route's responses may be reused, and what they vary on."""
+
+    max_age: int = 60
+    vary: Tuple[str, ...] = ()
+    private: bool = False
+
+    @property
+    def cache_control(self) -> bytes:
+        visibility = "private" if self.private else "public"
+        return f"{visibility}, max-age={self.max_age}".encode()
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Headers
+    body: bytes
+    etag: bytes
+    stored_at: float
+
+
+class MemoryStore:
+    """In-process LRU of responses, bounded by total body size."""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_bytes:
+            return
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= len(old.body)
+        self._entries[key] = entry
+        self._bytes += len(entry.body)
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.body)
+
+
+class SQLiteStore:
+    """Responses in a SQLite file, shared by every worker process."""
+
+    name = "sqlite"
+
+    def __init__(self, path: str, max_entries: int = 10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "status INTEGER, headers TEXT, body BLOB, etag TEXT, "
+                "stored_at REAL)"
+            )
+            self._local.db = db
+        return db
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        row = self._db.execute(
+            "SELECT status, headers, body, etag, stored_at FROM responses "
+            "WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+        status, headers, body, etag, stored_at = row
+        return CachedResponse(
+            status,
+            [
+                (k.encode("latin-1"), v.encode("latin-1"))
+                for k, v in json.loads(headers)
+            ],
+            body,
+            etag.encode(),
+            stored_at,
+        )
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        headers = json.dumps(
+            [(k.decode("latin-1"), v.decode("latin-1")) for k, v in entry.headers]
+        )
+        db = self._db
+        db.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                key,
+                entry.status,
+                headers,
+                entry.body,
+                entry.etag.decode(),
+                entry.stored_at,
+            ),
+        )
+        db.execute(
+            "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+
+def store_from_env() -> Any:
+    """HTTP_CACHE_BACKEND=sqlite shares HTTP_CACHE_PATH across workers."""
+    if os.getenv("HTTP_CACHE_BACKEND", "memory") == "sqlite":
+        return SQLiteStore(os.getenv("HTTP_CACHE_PATH", "http_cache.db"))
+    return MemoryStore()
+
+
+def strong_etag(body: bytes) -> bytes:
+    return b'"' + hashlib.sha256(body).hexdigest()[:32].encode() + b'"'
+
+
+class HTTPCacheMiddleware:
+    """Cache GET responses of the routes listed in ``policies``.
+
+    Responses are keyed by method, path, query string and the policy's ``vary``
+    request headers, and reused for ``max_age`` seconds. Every cached or
+    cacheable 200 carries a strong ``ETag`` and ``Cache-Control``; a request
+    whose ``If-None-Match`` matches gets ``304 Not Modified`` with no body.
+    A request sending ``Cache-Control: no-cache`` always reaches the handler.
+    """
+
+    def __init__(
+        self,
+        app: Any,
+        policies: Dict[str, CachePolicy],
+        store: Any = None,
+    ):
+        self.app = app
+        self.policies = policies
+        self.store = store if store is not None else store_from_env()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        policy = None
+        if scope["type"] == "http" and scope["method"] == "GET":
+            policy = self.policies.get(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        key = "\n".join(
+            [scope["method"], scope["path"], scope["query_string"].decode("latin-1")]
+            + [
+                headers.get(name.lower().encode(), b"").decode("latin-1")
+                for name in policy.vary
+            ]
+        )
+        if b"no-cache" not in headers.get(b"cache-control", b""):
+            entry = self.store.get(key)
+            if entry is not None and time.time() - entry.stored_at < policy.max_age:
+                self.hits += 1
+                await self._respond(send, entry, policy, headers)
+                return
+
+        self.misses += 1
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def capture(message: Dict[str, Any]) -> None:
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+        body = b"".join(chunks)
+        if start.get("status") != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        entry = CachedResponse(
+            200,
+            [
+                (k, v)
+                for k, v in start.get("headers", [])
+                if k not in (b"content-length", b"etag", b"cache-control")
+            ],
+            body,
+            strong_etag(body),
+            time.time(),
+        )
+        self.store.put(key, entry)
+        await self._respond(send, entry, policy, headers)
+
+    async def _respond(
+        self,
+        send: Any,
+        entry: CachedResponse,
+        policy: CachePolicy,
+        request_headers: Dict[bytes, bytes],
+    ) -> None:
+        headers = [
+            (b"etag", entry.etag),
+            (b"cache-control", policy.cache_control),
+        ]
+        if policy.vary:
+            headers.append((b"vary", ", ".join(policy.vary).encode()))
+        age = int(time.time() - entry.stored_at)
+        if age:
+            headers.append((b"age", str(age).encode()))
+
+        # If-None-Match uses the weak comparison (RFC 9110 13.1.2): W/ is ignored
+        if_none_match = request_headers.get(b"if-none-match", b"")
+        tags = [tag.strip() for tag in if_none_match.split(b",")]
+        tags = [tag[2:] if tag.startswith(b"W/") else tag for tag in tags]
+        if entry.etag in tags or if_none_match.strip() == b"*":
+            self.not_modified += 1
+            await send(
+                {"type": "http.response.start", "status": 304, "headers": headers}
+            )
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers += entry.headers
+        headers.append((b"content-length", str(len(entry.body)).encode()))
+        await send(
+            {"type": "http.response.start", "status": entry.status, "headers": headers}
+        )
+        await send({"type": "http.response.body", "body": entry.body})
@@ -0,0 +1,187 @@
+import asyncio
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds in seconds of the loop lag histogram buckets
+LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class BlockingDetector:
+    """Spot async routes that block the event loop, by sampling loop lag.
+
+    A task on the loop sleeps ``interval`` seconds at a time and records how
+    late it wakes up. A watchdog thread notices when the loop has not woken
+    it for ``threshold`` seconds, and captures the loop thread's stack: the
+    innermost route endpoint on it is reported as the offender and flagged.
+
+    With ``offload``, later calls to a flagged ``async def`` endpoint run on
+    their own event loop in a pool of ``max_workers`` threads, so one bad
+    handler no longer stalls every other client. Only offload handlers that
+    do not use loop-bound objects such as an ``AsyncSession`` from a
+    dependency.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.02,
+        threshold: float = 0.1,
+        offload: bool = False,
+        max_workers: int = 4,
+    ):
+        self.interval = interval
+        self.threshold = threshold
+        self.offload = offload
+        self.max_workers = max_workers
+        self.flagged: Set[str] = set()
+        self.blocked = Counter()
+        self.lag_buckets = [0] * len(LAG_BUCKETS)
+        self.lag_count = 0
+        self.lag_sum = 0.0
+        self._endpoints: Dict[Any, str] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._heartbeat = time.monotonic()
+        self._loop_thread: Optional[int] = None
+        self._stack: Optional[List[str]] = None
+        self._route: Optional[str] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def install(self, app: Any) -> None:
+        """Map each route endpoint's code to its route, wrapping it for offload."""
+        for route in app.routes:
+            if not isinstance(route, APIRoute):
+                continue
+            name = f"{','.join(sorted(route.methods))} {route.path}"
+            call = route.dependant.call
+            self._endpoints[call.__code__] = name
+            if self.offload and asyncio.iscoroutinefunction(call):
+                route.dependant.call = self._offloadable(name, call)
+
+    def _offloadable(self, name: str, call: Callable) -> Callable:
+        @functools.wraps(call)
+        async def endpoint(**kwargs: Any) -> Any:
+            if name not in self.flagged:
+                return await call(**kwargs)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="offload"
+                )
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor, lambda: asyncio.run(call(**kwargs))
+            )
+
+        return endpoint
+
+    def start(self) -> None:
+        """Start sampling the running loop; later calls do nothing."""
+        if self._task is not None:
+            return
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        threading.Thread(target=self._watch, name="loop-watchdog", daemon=True).start()
+
+    async def _sample(self) -> None:
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(self.interval)
+            self._heartbeat = now = time.monotonic()
+            lag = max(0.0, now - start - self.interval)
+            self._record(lag)
+            if lag >= self.threshold:
+                self._report(lag)
+
+    def _record(self, lag: float) -> None:
+        self.lag_count += 1
+        self.lag_sum += lag
+        for i, bound in enumerate(LAG_BUCKETS):
+            if lag <= bound:
+                self.lag_buckets[i] += 1
+                break
+
+    def _watch(self) -> None:
+        while True:
+            time.sleep(self.interval)
+            stalled = time.monotonic() - self._heartbeat
+            if stalled < self.threshold or self._stack is not None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._route, depth = self._innermost_route(frame)
+            # From the endpoint down to the blocking call, when there is one
+            self._stack = traceback.format_stack(frame, limit=depth or 20)
+
+    def _innermost_route(self, frame: Any) -> Tuple[Optional[str], int]:
+        depth = 0
+        while frame is not None:
+            depth += 1
+            route = self._endpoints.get(frame.f_code)
+            if route is not None:
+                return route, depth
+            frame = frame.f_back
+        return None, 0
+
+    def _report(self, lag: float) -> None:
+        route, stack = self._route, self._stack
+        self._route = self._stack = None
+        if route is not None:
+            self.blocked[route] += 1
+            self.flagged.add(route)
+        logger.warning(
+            f"Event loop blocked for {lag * 1000:.0f} ms in "
+            f"{route or 'an unknown route'}\n{''.join(stack or [])}"
+        )
+
+    def prometheus(self, prefix: str = "fastapi") -> str:
+        lines = [
+            f"# HELP {prefix}_event_loop_lag_seconds How late the event loop "
+            "ran a sleeping task",
+            f"# TYPE {prefix}_event_loop_lag_seconds histogram",
+        ]
+        cumulative = 0
+        for bound, count in zip(LAG_BUCKETS, self.lag_buckets):
+            cumulative += count
+            lines.append(
+                f'{prefix}_event_loop_lag_seconds_bucket{{le="{bound}"}} {cumulative}'
+            )
+        lines += [
+            f'{prefix}_event_loop_lag_seconds_bucket{{le="+Inf"}} {self.lag_count}',
+            f"{prefix}_event_loop_lag_seconds_sum {self.lag_sum}",
+            f"{prefix}_event_loop_lag_seconds_count {self.lag_count}",
+            f"# HELP {prefix}_event_loop_blocked_total Times a route blocked the "
+            "event loop",
+            f"# TYPE {prefix}_event_loop_blocked_total counter",
+        ]
+        for route, count in sorted(self.blocked.items()):
+            lines.append(
+                f'{prefix}_event_loop_blocked_total{{route="{route}"}} {count}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+class BlockingDetectorMiddleware:
+    """ASGI middleware that attaches a ``BlockingDetector`` to the app."""
+
+    def __init__(self, app: Any, detector: BlockingDetector):
+        self.app = app
+        self.detector = detector
+        self._installed = False
+
+    async def __call__(self, scope: Dict[str, Any], receive: Any, send: Any) -> None:
+        if not self._installed:
+            self._installed = True
+            self.detector.install(scope["app"])
+            self.detector.start()
+        await self.app(scope, receive, send)